@@ -27,6 +27,15 @@ logger = get_logger(__name__)
 # Global database instance - path set via initialize_database()
 db = peewee.SqliteDatabase(None)
 
+# Connection pragmas: WAL lets readers proceed during writes, and with
+# synchronous=NORMAL a commit no longer forces an fsync of the main file.
+SQLITE_PRAGMAS = {
+    "journal_mode": "wal",
+    "synchronous": "normal",
+    "temp_store": "memory",
+    "mmap_size": 268435456,  # 256 MiB
+}
+
 
 # =============================================================================
 # Base Model
@@ -66,7 +75,7 @@ def initialize_database(db_path: str) -> None:
     logger.debug(f"Initializing database at: {db_path}")
 
     try:
-        db.init(db_path)
+        db.init(db_path, pragmas=SQLITE_PRAGMAS)
         db.connect()
         db.create_tables([Node, Task], safe=True)
         logger.info(f"Database initialized: {db_path}")
@@ -110,5 +119,4 @@ async def run_in_executor(func, *args, **kwargs):
     Example:
         task = await run_in_executor(Task.get_or_none, Task.task_id == task_id)
     """
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, lambda: func(*args, **kwargs))
+    return await asyncio.to_thread(func, *args, **kwargs)
@@ -14,6 +14,51 @@ from kohakuriver.db.base import BaseModel
 from kohakuriver.models.enums import NodeStatus
 
 
+# =============================================================================
+# JSON Column Parsers
+# =============================================================================
+
+
+def parse_numa_topology(raw: str | None) -> dict[int, list[int]] | None:
+    """
+    Parse a raw NUMA topology JSON column value.
+
+    Usable on rows fetched with ``.dicts()`` as well as on model instances.
+
+    Args:
+        raw: Stored JSON string (or None).
+
+    Returns:
+        Dict mapping NUMA node ID to list of CPU core IDs,
+        or None if not set or invalid.
+    """
+    if not raw:
+        return None
+    try:
+        data = json.loads(raw)
+        return {int(k): v for k, v in data.items()}
+    except (json.JSONDecodeError, ValueError):
+        return None
+
+
+def parse_gpu_info(raw: str | None) -> list[dict]:
+    """
+    Parse a raw GPU info JSON column value.
+
+    Args:
+        raw: Stored JSON string (or None).
+
+    Returns:
+        List of GPU info dicts, or empty list if not set or invalid.
+    """
+    if not raw:
+        return []
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
+        return []
+
+
 # =============================================================================
 # Node Model
 # =============================================================================
@@ -86,13 +131,7 @@ class Node(BaseModel):
             Dict mapping NUMA node ID to list of CPU core IDs,
             or None if not set or invalid.
         """
-        if not self.numa_topology:
-            return None
-        try:
-            data = json.loads(self.numa_topology)
-            return {int(k): v for k, v in data.items()}
-        except (json.JSONDecodeError, ValueError):
-            return None
+        return parse_numa_topology(self.numa_topology)
 
     def set_numa_topology(self, topology: dict[int, list[int]] | None) -> None:
         """Store NUMA topology as JSON."""
@@ -108,12 +147,7 @@ class Node(BaseModel):
         Returns:
             List of GPU info dicts, or empty list if not set or invalid.
         """
-        if not self.gpu_info:
-            return []
-        try:
-            return json.loads(self.gpu_info)
-        except json.JSONDecodeError:
-            return []
+        return parse_gpu_info(self.gpu_info)
 
     def set_gpu_info(self, gpus: list[dict] | None) -> None:
         """Store GPU info as JSON."""
@@ -14,8 +14,8 @@ Submodules:
     - utils: Tarball and sync utilities
 """
 
-from kohakuriver.docker import utils
-from kohakuriver.docker.client import DockerManager, get_docker_manager
+import importlib
+
 from kohakuriver.docker.exceptions import (
     ContainerCreationError,
     ContainerNotFoundError,
@@ -44,6 +44,26 @@ from kohakuriver.docker.naming import (
     vps_container_name,
 )
 
+# The client and utils modules import the docker SDK (and requests/urllib3),
+# which is slow to load. Resolve them on first access so callers that only
+# need naming helpers or exceptions (e.g. the CLI) skip that cost.
+_LAZY_ATTRS = {
+    "utils": ("kohakuriver.docker.utils", None),
+    "DockerManager": ("kohakuriver.docker.client", "DockerManager"),
+    "get_docker_manager": ("kohakuriver.docker.client", "get_docker_manager"),
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = _LAZY_ATTRS[name]
+    module = importlib.import_module(module_name)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     # Utils module
     "utils",
@@ -11,13 +11,16 @@ Features:
     - Container synchronization via shared storage tarballs
 """
 
+import calendar
 import datetime
 import os
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import docker
-from docker.errors import APIError, ContainerError, ImageNotFound, NotFound
+from docker.errors import APIError, ImageNotFound, NotFound
 from docker.models.containers import Container
 from docker.models.images import Image
 from docker.types import DeviceRequest, Mount
@@ -42,6 +45,223 @@ from kohakuriver.utils.logger import get_logger
 
 log = get_logger(__name__)
 
+# Connection pool size for the daemon socket. docker-py defaults to 10, which
+# serializes requests once more worker threads than that talk to the daemon.
+DOCKER_MAX_POOL_SIZE = 64
+
+# Parallel removals issued by cleanup_stopped_containers.
+CLEANUP_WORKERS = 8
+
+# Write buffer for image tarballs; docker-py yields small chunks.
+TARBALL_WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Tarball directories already created by this process.
+_ensured_tarball_dirs: set[str] = set()
+
+
+# =============================================================================
+# Package Manager Detection Cache
+# =============================================================================
+
+# Detected package manager per image ID. Image IDs are content-addressed, so
+# entries never go stale; shared at module level because DockerManager is
+# instantiated per request in many call sites.
+_package_manager_cache: dict[str, str] = {}
+
+# Package managers in order of preference, probed in a single container run.
+PACKAGE_MANAGERS = ("apk", "apt-get", "apt", "dnf", "yum", "zypper", "pacman")
+_PACKAGE_MANAGER_PROBE = (
+    f"for m in {' '.join(PACKAGE_MANAGERS)}; do command -v $m; done; true"
+)
+_PACKAGE_MANAGER_RE = re.compile(
+    rb"/(" + b"|".join(m.encode() for m in PACKAGE_MANAGERS) + rb")$", re.MULTILINE
+)
+
+# SSH server install command per package manager.
+SSH_INSTALL_COMMANDS = {
+    "apk": "apk update && apk add --no-cache openssh",
+    "apt": "apt update && apt install -y openssh-server",
+    "apt-get": "apt-get update && apt-get install -y openssh-server",
+    "dnf": "dnf install -y openssh-server",
+    "yum": "yum install -y openssh-server",
+    "zypper": "zypper refresh && zypper install -y openssh",
+    "pacman": "pacman -Syu --noconfirm openssh",
+}
+SSH_PREINSTALLED_COMMAND = "echo 'SSH server should be pre-installed'"
+
+# Steps after install and auth setup; identical for every VPS.
+_SSH_START_COMMAND = " && ".join(
+    [
+        "mkdir -p /run/sshd",
+        "chmod 0755 /run/sshd",
+        "/usr/sbin/sshd -D -e",
+    ]
+)
+_SSH_KEY_AUTH_TEMPLATE = " && ".join(
+    [
+        "echo 'PasswordAuthentication no' >> /etc/ssh/sshd_config",
+        "echo 'PermitRootLogin prohibit-password' >> /etc/ssh/sshd_config",
+        "mkdir -p /root/.ssh",
+        "echo '{public_key}' > /root/.ssh/authorized_keys",
+        "chmod 700 /root/.ssh",
+        "chmod 600 /root/.ssh/authorized_keys",
+    ]
+)
+_SSH_PASSWORD_AUTH_TEMPLATE = " && ".join(
+    [
+        "echo 'PasswordAuthentication yes' >> /etc/ssh/sshd_config",
+        "echo 'PermitRootLogin yes' >> /etc/ssh/sshd_config",
+        "echo 'root:{task_id}' | chpasswd",
+    ]
+)
+
+
+# =============================================================================
+# Image Timestamp Cache
+# =============================================================================
+
+# Image creation timestamps by tag. Filled on lookup and dropped whenever this
+# process loads, commits, pulls or removes an image, so the steady-state
+# needs_sync check avoids a daemon round-trip.
+_image_timestamp_cache: dict[str, int] = {}
+
+
+def parse_docker_timestamp(created: str) -> int:
+    """
+    Parse a Docker RFC 3339 timestamp into Unix seconds.
+
+    Docker reports UTC times like ``2024-01-02T03:04:05.123456789Z``; those are
+    parsed by slicing, anything else falls back to ``fromisoformat``.
+
+    Args:
+        created: Timestamp string from image or container attributes.
+
+    Returns:
+        Unix timestamp in whole seconds.
+
+    Raises:
+        ValueError: If the string is not a valid timestamp.
+    """
+    if (
+        len(created) >= 20
+        and created[-1] == "Z"
+        and created[4] == "-"
+        and created[10] == "T"
+        and created[19] in ".Z"
+    ):
+        return calendar.timegm(
+            (
+                int(created[0:4]),
+                int(created[5:7]),
+                int(created[8:10]),
+                int(created[11:13]),
+                int(created[14:16]),
+                int(created[17:19]),
+                0,
+                0,
+                0,
+            )
+        )
+    dt = datetime.datetime.fromisoformat(created.replace("Z", "+00:00"))
+    return int(dt.timestamp())
+
+
+def get_cached_image_timestamp(tag: str) -> int | None:
+    """
+    Get a cached image creation timestamp.
+
+    Args:
+        tag: Image tag.
+
+    Returns:
+        Unix timestamp, or None if not cached.
+    """
+    return _image_timestamp_cache.get(tag)
+
+
+def cache_image_timestamp(tag: str, timestamp: int) -> None:
+    """
+    Remember an image creation timestamp read from the daemon.
+
+    Args:
+        tag: Image tag.
+        timestamp: Unix timestamp of the image creation.
+    """
+    _image_timestamp_cache[tag] = timestamp
+
+
+def invalidate_image_timestamp(tag: str | None = None) -> None:
+    """
+    Drop a cached image creation timestamp.
+
+    Args:
+        tag: Image tag to forget, or None to clear the whole cache.
+    """
+    if tag is None:
+        _image_timestamp_cache.clear()
+    else:
+        _image_timestamp_cache.pop(tag, None)
+
+
+# Image references known to be present locally, so container creation can
+# skip the existence check. Filled on inspect, pull, commit and load.
+_known_local_images: set[str] = set()
+
+
+# =============================================================================
+# Background Maintenance
+# =============================================================================
+
+# Single worker: housekeeping (old tarball removal, image pruning) is not on
+# the caller's critical path and only needs to run one job at a time.
+_maintenance_executor = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="docker-maintenance"
+)
+
+
+# =============================================================================
+# Tarball Writing
+# =============================================================================
+
+
+def ensure_tarball_dir(directory: str) -> None:
+    """Create a tarball directory once per process."""
+    if directory and directory not in _ensured_tarball_dirs:
+        os.makedirs(directory, exist_ok=True)
+        _ensured_tarball_dirs.add(directory)
+
+
+def write_image_tarball(image: Image, output_path: str, named: bool = False) -> None:
+    """
+    Stream an image export to a tarball through a large write buffer.
+
+    Args:
+        image: Image to export.
+        output_path: Path for the tarball.
+        named: Preserve repository/tag names in the tarball.
+    """
+    with open(output_path, "wb", buffering=TARBALL_WRITE_BUFFER_SIZE) as f:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        for chunk in image.save(named=named):
+            f.write(chunk)
+
+
+def open_image_tarball(tarball_path: str):
+    """
+    Open a tarball for streaming into the daemon with readahead hinted.
+
+    Args:
+        tarball_path: Path to the tarball.
+
+    Returns:
+        Binary file object positioned at the start of the tarball.
+    """
+    f = open(tarball_path, "rb")
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    return f
+
 
 # =============================================================================
 # DockerManager Class
@@ -72,7 +292,9 @@ class DockerManager:
             DockerConnectionError: If connection to Docker daemon fails.
         """
         try:
-            self.client = docker.from_env(timeout=timeout)
+            self.client = docker.from_env(
+                timeout=timeout, max_pool_size=DOCKER_MAX_POOL_SIZE
+            )
             self.client.ping()
             log.debug("Docker client initialized successfully")
         except Exception as e:
@@ -93,11 +315,14 @@ class DockerManager:
         Returns:
             True if container exists, False otherwise.
         """
-        try:
-            self.client.containers.get(name)
-            return True
-        except NotFound:
-            return False
+        # A listing filter answers in one call without a 404 on the miss path.
+        # The daemon matches the name filter against "/<name>".
+        matches = self.client.api.containers(
+            all=True,
+            quiet=True,
+            filters={"name": f"^/{re.escape(name)}$"},
+        )
+        return bool(matches)
 
     def get_container(self, name: str) -> Container:
         """
@@ -145,7 +370,10 @@ class DockerManager:
         Raises:
             ContainerCreationError: If container creation fails.
         """
+        known_local = image in _known_local_images
         try:
+            if not known_local:
+                self._ensure_local_image(image)
             return self.client.containers.run(
                 image,
                 command,
@@ -154,8 +382,15 @@ class DockerManager:
                 **kwargs,
             )
         except ImageNotFound:
+            if not known_local:
+                # _ensure_local_image just inspected or pulled it; pulling
+                # again would only repeat the same registry round-trip.
+                raise
+            # Image vanished behind our back (e.g. removed via the CLI).
+            _known_local_images.discard(image)
             log.info(f"Image {image} not found locally, pulling...")
             self.client.images.pull(image)
+            _known_local_images.add(image)
             return self.client.containers.run(
                 image,
                 command,
@@ -167,6 +402,15 @@ class DockerManager:
             log.error(f"Failed to create container {name}: {e}")
             raise ContainerCreationError(str(e), name) from e
 
+    def _ensure_local_image(self, image: str) -> None:
+        """Make sure an image is present locally, pulling it if needed."""
+        try:
+            self.client.api.inspect_image(image)
+        except ImageNotFound:
+            log.info(f"Image {image} not found locally, pulling...")
+            self.client.images.pull(image)
+        _known_local_images.add(image)
+
     def create_task_container(
         self,
         task_id: int,
@@ -342,69 +586,66 @@ class DockerManager:
         install_cmd = self._get_ssh_install_command(pkg_manager)
         auth_config = self._get_ssh_auth_config(public_key, task_id)
 
-        return (
-            f"{install_cmd} && "
-            "ssh-keygen -A && "
-            f"{auth_config} && "
-            "mkdir -p /run/sshd && "
-            "chmod 0755 /run/sshd && "
-            "/usr/sbin/sshd -D -e"
+        return " && ".join(
+            (install_cmd, "ssh-keygen -A", auth_config, _SSH_START_COMMAND)
         )
 
     def _get_ssh_install_command(self, pkg_manager: str) -> str:
         """Get SSH server install command for package manager."""
-        match pkg_manager:
-            case "apk":
-                return "apk update && apk add --no-cache openssh"
-            case "apt" | "apt-get":
-                return (
-                    f"{pkg_manager} update && {pkg_manager} install -y openssh-server"
-                )
-            case "dnf":
-                return "dnf install -y openssh-server"
-            case "yum":
-                return "yum install -y openssh-server"
-            case "zypper":
-                return "zypper refresh && zypper install -y openssh"
-            case "pacman":
-                return "pacman -Syu --noconfirm openssh"
-            case _:
-                return "echo 'SSH server should be pre-installed'"
+        return SSH_INSTALL_COMMANDS.get(pkg_manager, SSH_PREINSTALLED_COMMAND)
 
     def _get_ssh_auth_config(self, public_key: str | None, task_id: int) -> str:
         """Get SSH authentication configuration."""
         if public_key:
-            return (
-                "echo 'PasswordAuthentication no' >> /etc/ssh/sshd_config && "
-                "echo 'PermitRootLogin prohibit-password' >> /etc/ssh/sshd_config && "
-                "mkdir -p /root/.ssh && "
-                f"echo '{public_key}' > /root/.ssh/authorized_keys && "
-                "chmod 700 /root/.ssh && "
-                "chmod 600 /root/.ssh/authorized_keys"
-            )
-        return (
-            "echo 'PasswordAuthentication yes' >> /etc/ssh/sshd_config && "
-            "echo 'PermitRootLogin yes' >> /etc/ssh/sshd_config && "
-            f"echo 'root:{task_id}' | chpasswd"
-        )
+            return _SSH_KEY_AUTH_TEMPLATE.format(public_key=public_key)
+        return _SSH_PASSWORD_AUTH_TEMPLATE.format(task_id=task_id)
 
     def _detect_package_manager(self, image: str) -> str:
-        """Detect package manager in an image."""
-        managers = ["apk", "apt-get", "apt", "dnf", "yum", "zypper", "pacman"]
-
-        for manager in managers:
-            try:
-                result = self.client.containers.run(
-                    image,
-                    ["which", manager],
-                    remove=True,
-                    detach=False,
-                )
-                if result:
-                    log.debug(f"Detected package manager: {manager}")
-                    return manager
-            except (ContainerError, Exception):
-                continue
+        """Detect package manager in an image, cached per image ID."""
+        try:
+            image_id = self.client.images.get(image).id
+        except Exception:
+            image_id = None
+
+        if image_id and image_id in _package_manager_cache:
+            return _package_manager_cache[image_id]
+
+        manager = self._probe_package_manager(image)
+        if manager is None:
+            # Probe failed (daemon error, container start failure); don't
+            # cache so the next attempt probes again
+            return "unknown"
+        if image_id:
+            _package_manager_cache[image_id] = manager
+        return manager
+
+    def _probe_package_manager(self, image: str) -> str | None:
+        """
+        Probe an image for its package manager with one throwaway container.
+
+        Returns:
+            The package manager, "unknown" if none was found, or None if
+            the probe itself failed.
+        """
+        try:
+            output = self.client.containers.run(
+                image,
+                ["/bin/sh", "-c", _PACKAGE_MANAGER_PROBE],
+                stdout=True,
+                stderr=False,
+                remove=True,
+                detach=False,
+            )
+        except Exception as e:
+            log.warning(f"Package manager probe failed for {image}: {e}")
+            return None
+
+        # The probe prints paths in preference order, so the first hit wins.
+        match = _PACKAGE_MANAGER_RE.search(output or b"")
+        if match:
+            manager = match.group(1).decode()
+            log.debug(f"Detected package manager: {manager}")
+            return manager
 
         log.debug("Could not detect package manager, assuming SSH pre-installed")
         return "unknown"
@@ -412,6 +653,8 @@ class DockerManager:
     # =========================================================================
     # Container Lifecycle
     # =========================================================================
+    # These go through the low-level API by name, which costs one daemon call
+    # per operation instead of an inspect followed by the action.
 
     def stop_container(self, name: str, timeout: int = 10) -> bool:
         """
@@ -425,8 +668,7 @@ class DockerManager:
             True if stopped successfully, False otherwise.
         """
         try:
-            container = self.client.containers.get(name)
-            container.stop(timeout=timeout)
+            self.client.api.stop(name, timeout=timeout)
             log.info(f"Container {name} stopped")
             return True
         except NotFound:
@@ -447,8 +689,7 @@ class DockerManager:
             True if started successfully, False otherwise.
         """
         try:
-            container = self.client.containers.get(name)
-            container.start()
+            self.client.api.start(name)
             log.info(f"Container {name} started")
             return True
         except NotFound:
@@ -470,8 +711,7 @@ class DockerManager:
             True if removed successfully, False otherwise.
         """
         try:
-            container = self.client.containers.get(name)
-            container.remove(force=force)
+            self.client.api.remove_container(name, force=force)
             log.info(f"Container {name} removed")
             return True
         except NotFound:
@@ -495,8 +735,7 @@ class DockerManager:
             ContainerNotFoundError: If container doesn't exist.
         """
         try:
-            container = self.client.containers.get(name)
-            container.pause()
+            self.client.api.pause(name)
             log.info(f"Container {name} paused")
             return True
         except NotFound:
@@ -519,8 +758,7 @@ class DockerManager:
             ContainerNotFoundError: If container doesn't exist.
         """
         try:
-            container = self.client.containers.get(name)
-            container.unpause()
+            self.client.api.unpause(name)
             log.info(f"Container {name} unpaused")
             return True
         except NotFound:
@@ -541,8 +779,7 @@ class DockerManager:
             True if killed successfully, False otherwise.
         """
         try:
-            container = self.client.containers.get(name)
-            container.kill(signal=signal)
+            self.client.api.kill(name, signal=signal)
             log.info(f"Container {name} killed with {signal}")
             return True
         except NotFound:
@@ -568,14 +805,17 @@ class DockerManager:
             Host port number, or None if not found.
         """
         try:
-            container = self.client.containers.get(name)
-            ports = container.attrs["NetworkSettings"]["Ports"]
-            port_key = f"{container_port}/tcp"
-            if port_key in ports and ports[port_key]:
-                return int(ports[port_key][0]["HostPort"])
+            info = self.client.api.inspect_container(name)
+        except NotFound:
             return None
-        except (NotFound, KeyError, IndexError, TypeError):
+
+        # Ports is null for containers that are not running.
+        ports = (info.get("NetworkSettings") or {}).get("Ports") or {}
+        bindings = ports.get(f"{container_port}/tcp")
+        if not bindings:
             return None
+        host_port = bindings[0].get("HostPort")
+        return int(host_port) if host_port else None
 
     def list_kohakuriver_containers(self, all: bool = False) -> list[Container]:
         """
@@ -609,10 +849,44 @@ class DockerManager:
         """
         return self.client.containers.list(all=all, filters=filters)
 
+    def list_container_summaries(
+        self,
+        all: bool = False,
+        filters: dict | None = None,
+    ) -> list[dict]:
+        """
+        List containers as the daemon's raw summary dicts.
+
+        Unlike list_containers, this does not inspect each container, so the
+        whole listing costs a single daemon round-trip.
+
+        Args:
+            all: Include stopped containers.
+            filters: Docker filters dict.
+
+        Returns:
+            List of summary dicts (Id, Names, ImageID, State, Created, ...).
+        """
+        return self.client.api.containers(all=all, filters=filters)
+
     def list_images(self) -> list[Image]:
         """List all local images."""
         return self.client.images.list()
 
+    def image_tags_by_id(self) -> dict[str, list[str]]:
+        """
+        Map local image IDs to their repository tags in one daemon call.
+
+        Returns:
+            Dict of image ID to tags (untagged images map to an empty list).
+        """
+        return {
+            image["Id"]: [
+                tag for tag in (image.get("RepoTags") or []) if tag != "<none>:<none>"
+            ]
+            for image in self.client.api.images()
+        }
+
     def cleanup_stopped_containers(self) -> int:
         """
         Remove stopped HakuRiver containers.
@@ -620,16 +894,35 @@ class DockerManager:
         Returns:
             Number of containers removed.
         """
-        removed = 0
-        for container in self.list_kohakuriver_containers(all=True):
-            if container.status in ("exited", "dead"):
-                try:
-                    container.remove()
-                    removed += 1
-                    log.info(f"Removed stopped container {container.name}")
-                except APIError:
-                    pass
-        return removed
+        # Raw listing: containers.list() would inspect every container to
+        # build models, while only the ID and name are needed here. The
+        # daemon applies the status filter, so running containers are never
+        # sent back.
+        stopped = self.client.api.containers(
+            all=True,
+            filters={
+                "label": f"{LABEL_MANAGED}=true",
+                "status": ["exited", "dead"],
+            },
+        )
+        if not stopped:
+            return 0
+
+        # Removals are independent; issue them concurrently over the pool.
+        workers = min(CLEANUP_WORKERS, len(stopped))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return sum(executor.map(self._remove_stopped_container, stopped))
+
+    def _remove_stopped_container(self, container: dict) -> bool:
+        """Remove one stopped container, returning whether it was removed."""
+        names = container.get("Names") or []
+        name = names[0].lstrip("/") if names else container["Id"][:12]
+        try:
+            self.client.api.remove_container(container["Id"])
+            log.info(f"Removed stopped container {name}")
+            return True
+        except APIError:
+            return False
 
     # =========================================================================
     # Image Operations
@@ -658,7 +951,10 @@ class DockerManager:
     def pull_image(self, tag: str) -> Image:
         """Pull an image from registry."""
         log.info(f"Pulling image {tag}...")
-        return self.client.images.pull(tag)
+        invalidate_image_timestamp(tag)
+        image = self.client.images.pull(tag)
+        _known_local_images.add(tag)
+        return image
 
     def commit_container(
         self,
@@ -684,6 +980,8 @@ class DockerManager:
         try:
             container = self.client.containers.get(container_name)
             image = container.commit(repository=repository, tag=tag)
+            invalidate_image_timestamp(f"{repository}:{tag}")
+            _known_local_images.add(f"{repository}:{tag}")
             log.info(f"Committed container {container_name} to {repository}:{tag}")
             return image
         except NotFound:
@@ -707,10 +1005,8 @@ class DockerManager:
             image = self.client.images.get(tag)
             log.info(f"Saving image {tag} to {output_path}...")
 
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            with open(output_path, "wb") as f:
-                for chunk in image.save():
-                    f.write(chunk)
+            ensure_tarball_dir(os.path.dirname(output_path))
+            write_image_tarball(image, output_path)
 
             log.info(f"Image saved to {output_path}")
         except ImageNotFound:
@@ -736,8 +1032,11 @@ class DockerManager:
 
         try:
             log.info(f"Loading image from {tarball_path}...")
-            with open(tarball_path, "rb") as f:
+            with open_image_tarball(tarball_path) as f:
                 images = self.client.images.load(f)
+            invalidate_image_timestamp()
+            for image in images:
+                _known_local_images.update(image.tags)
             log.info(f"Loaded {len(images)} image(s) from {tarball_path}")
             return images
         except Exception as e:
@@ -753,12 +1052,17 @@ class DockerManager:
         Returns:
             Unix timestamp, or None if not found.
         """
+        cached = get_cached_image_timestamp(tag)
+        if cached is not None:
+            return cached
+
         try:
             image = self.client.images.get(tag)
             created_str = image.attrs.get("Created", "")
             if created_str:
-                dt = datetime.datetime.fromisoformat(created_str.replace("Z", "+00:00"))
-                return int(dt.timestamp())
+                timestamp = parse_docker_timestamp(created_str)
+                cache_image_timestamp(tag, timestamp)
+                return timestamp
             return None
         except ImageNotFound:
             return None
@@ -777,6 +1081,8 @@ class DockerManager:
         Returns:
             True if removed successfully, False otherwise.
         """
+        invalidate_image_timestamp(tag)
+        _known_local_images.discard(tag)
         try:
             self.client.images.remove(tag, force=force)
             log.info(f"Removed image {tag}")
@@ -818,21 +1124,26 @@ class DockerManager:
         Returns:
             List of (timestamp, path) tuples, sorted newest first.
         """
-        pattern = re.compile(rf"^{re.escape(container_name.lower())}-(\d+)\.tar$")
+        prefix = f"{container_name.lower()}-"
+        suffix = ".tar"
         tar_files: list[tuple[int, str]] = []
 
-        if not os.path.isdir(container_tar_dir):
+        try:
+            entries = os.scandir(container_tar_dir)
+        except (FileNotFoundError, NotADirectoryError):
             return []
 
-        for filename in os.listdir(container_tar_dir):
-            match = pattern.match(filename)
-            if match:
-                try:
-                    timestamp = int(match.group(1))
-                    tar_path = os.path.join(container_tar_dir, filename)
-                    tar_files.append((timestamp, tar_path))
-                except ValueError:
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith(prefix) and name.endswith(suffix)):
+                    continue
+                stamp = name[len(prefix) : -len(suffix)]
+                if not (stamp.isascii() and stamp.isdigit()):
+                    continue
+                if not entry.is_file():
                     continue
+                tar_files.append((int(stamp), entry.path))
 
         tar_files.sort(key=lambda x: x[0], reverse=True)
         return tar_files
@@ -922,18 +1233,14 @@ class DockerManager:
             )
             self.save_image(kohakuriver_tag, tarball_path)
 
-            # Clean up old tarballs
-            for old_ts, old_path in self.list_shared_tarballs(
-                container_tar_dir, kohakuriver_name
-            ):
-                if old_ts < timestamp:
-                    try:
-                        os.remove(old_path)
-                        log.info(f"Removed old tarball: {old_path}")
-                    except OSError as e:
-                        log.warning(f"Failed to remove old tarball {old_path}: {e}")
-
-            self.prune_dangling_images()
+            # Old tarball cleanup and pruning can take a while; don't hold up
+            # the caller, which only needs the new tarball path.
+            _maintenance_executor.submit(
+                self._cleanup_after_tarball,
+                container_tar_dir,
+                kohakuriver_name,
+                timestamp,
+            )
 
             log.info(f"Created container tarball at {tarball_path}")
             return tarball_path
@@ -943,22 +1250,50 @@ class DockerManager:
             self.remove_image(kohakuriver_tag, force=True)
             return None
 
+    def _cleanup_after_tarball(
+        self,
+        container_tar_dir: str,
+        kohakuriver_name: str,
+        timestamp: int,
+    ) -> None:
+        """Remove tarballs older than timestamp and prune dangling images."""
+        for old_ts, old_path in self.list_shared_tarballs(
+            container_tar_dir, kohakuriver_name
+        ):
+            if old_ts < timestamp:
+                try:
+                    os.remove(old_path)
+                    log.info(f"Removed old tarball: {old_path}")
+                except OSError as e:
+                    log.warning(f"Failed to remove old tarball {old_path}: {e}")
+
+        try:
+            self.prune_dangling_images()
+        except APIError as e:
+            log.warning(f"Failed to prune dangling images: {e}")
+
 
 # =============================================================================
 # Global Instance
 # =============================================================================
 
 _docker_manager: DockerManager | None = None
+_docker_manager_lock = threading.Lock()
 
 
 def get_docker_manager() -> DockerManager:
     """
     Get the global DockerManager instance.
 
+    Safe to call from worker threads: concurrent first calls share one
+    instance instead of each connecting to the daemon.
+
     Returns:
         Lazily initialized DockerManager singleton.
     """
     global _docker_manager
     if _docker_manager is None:
-        _docker_manager = DockerManager()
+        with _docker_manager_lock:
+            if _docker_manager is None:
+                _docker_manager = DockerManager()
     return _docker_manager
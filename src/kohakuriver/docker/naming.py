@@ -15,6 +15,9 @@ Naming Patterns:
     - Snapshots: kohakuriver-snapshot/vps-{task_id}:{timestamp}
 """
 
+import functools
+import re
+
 # =============================================================================
 # Name Prefixes
 # =============================================================================
@@ -25,6 +28,15 @@ VPS_PREFIX: str = f"{KOHAKURIVER_PREFIX}-vps"
 ENV_PREFIX: str = f"{KOHAKURIVER_PREFIX}-env"
 SNAPSHOT_PREFIX: str = f"{KOHAKURIVER_PREFIX}-snapshot"
 
+# Full name prefixes (with separator) for task-bearing containers.
+_TASK_NAME_PREFIX: str = f"{TASK_PREFIX}-"
+_VPS_NAME_PREFIX: str = f"{VPS_PREFIX}-"
+_MANAGED_NAME_PREFIXES: tuple[str, ...] = (
+    _TASK_NAME_PREFIX,
+    _VPS_NAME_PREFIX,
+    f"{ENV_PREFIX}-",
+)
+
 
 # =============================================================================
 # Docker Labels
@@ -35,6 +47,17 @@ LABEL_TASK_ID: str = "kohakuriver.task_id"
 LABEL_TASK_TYPE: str = "kohakuriver.task_type"
 LABEL_NODE: str = "kohakuriver.node"
 
+# Static part of every container's labels; copied per container.
+_LABELS_TEMPLATE: dict[str, str] = {LABEL_MANAGED: "true"}
+
+
+# =============================================================================
+# Parsing Patterns
+# =============================================================================
+
+# namespace (up to the first "/"), name, and tag (after the last ":").
+_IMAGE_TAG_RE = re.compile(r"(?:([^/]*)/)?(.*?)(?::([^:]*))?", re.DOTALL)
+
 
 # =============================================================================
 # Container Name Generators
@@ -85,10 +108,14 @@ def env_container_name(env_name: str) -> str:
 # =============================================================================
 
 
+@functools.lru_cache(maxsize=1024)
 def image_tag(env_name: str, tag: str = "base") -> str:
     """
     Generate image tag for an environment.
 
+    Memoized: the same environment is resolved on every task dispatch, and
+    returning one string object keeps its hash cached for tag-keyed lookups.
+
     Args:
         env_name: Environment name.
         tag: Image tag (default: "base").
@@ -160,26 +187,8 @@ def parse_image_tag(full_tag: str) -> tuple[str, str, str]:
         >>> parse_image_tag("ubuntu")
         ('', 'ubuntu', 'latest')
     """
-    parts = full_tag.split("/")
-
-    match len(parts):
-        case 1:
-            namespace = ""
-            name_tag = parts[0]
-        case 2:
-            namespace = parts[0]
-            name_tag = parts[1]
-        case _:
-            namespace = parts[0]
-            name_tag = "/".join(parts[1:])
-
-    if ":" in name_tag:
-        name, tag = name_tag.rsplit(":", 1)
-    else:
-        name = name_tag
-        tag = "latest"
-
-    return namespace, name, tag
+    namespace, name, tag = _IMAGE_TAG_RE.fullmatch(full_tag).groups()
+    return namespace or "", name, "latest" if tag is None else tag
 
 
 # =============================================================================
@@ -205,11 +214,9 @@ def make_labels(
     Returns:
         Dictionary of Docker labels.
     """
-    labels = {
-        LABEL_MANAGED: "true",
-        LABEL_TASK_ID: str(task_id),
-        LABEL_TASK_TYPE: task_type,
-    }
+    labels = _LABELS_TEMPLATE.copy()
+    labels[LABEL_TASK_ID] = str(task_id)
+    labels[LABEL_TASK_TYPE] = task_type
     if node:
         labels[LABEL_NODE] = node
     return labels
@@ -224,13 +231,16 @@ def is_kohakuriver_container(container_name: str) -> bool:
     """
     Check if a container name matches HakuRiver naming convention.
 
+    Only task, VPS and environment container names are accepted, so unrelated
+    names that merely start with "kohakuriver" are not treated as managed.
+
     Args:
         container_name: Container name to check.
 
     Returns:
         True if the container is managed by HakuRiver.
     """
-    return container_name.startswith(KOHAKURIVER_PREFIX)
+    return container_name.startswith(_MANAGED_NAME_PREFIXES)
 
 
 def extract_task_id_from_name(container_name: str) -> int | None:
@@ -243,11 +253,12 @@ def extract_task_id_from_name(container_name: str) -> int | None:
     Returns:
         Task ID as integer, or None if not a valid HakuRiver container.
     """
-    for prefix in (TASK_PREFIX, VPS_PREFIX):
-        full_prefix = f"{prefix}-"
-        if container_name.startswith(full_prefix):
-            try:
-                return int(container_name[len(full_prefix) :])
-            except ValueError:
-                return None
-    return None
+    rest = container_name.removeprefix(_TASK_NAME_PREFIX)
+    if len(rest) == len(container_name):
+        rest = container_name.removeprefix(_VPS_NAME_PREFIX)
+        if len(rest) == len(container_name):
+            return None
+    try:
+        return int(rest)
+    except ValueError:
+        return None
@@ -13,18 +13,34 @@ Functions:
     - create_container_tar: Create tarball from existing container
 """
 
-import datetime
 import os
-import re
+import stat
 import time
 
 import docker
 
+from kohakuriver.docker.client import (
+    cache_image_timestamp,
+    ensure_tarball_dir,
+    get_cached_image_timestamp,
+    invalidate_image_timestamp,
+    open_image_tarball,
+    parse_docker_timestamp,
+    write_image_tarball,
+)
 from kohakuriver.docker.naming import image_tag
 from kohakuriver.utils.logger import get_logger
 
 log = get_logger(__name__)
 
+# Listings reused while the directory mtime is unchanged. A listing is only
+# trusted once its mtime is older than this, so changes landing within the
+# filesystem's timestamp granularity are not missed.
+TAR_LISTING_MTIME_SLACK_NS = 2_000_000_000
+
+# (container_tar_dir, container_name) -> (dir mtime_ns, sorted listing)
+_tar_listing_cache: dict[tuple[str, str], tuple[int, list[tuple[int, str]]]] = {}
+
 
 # =============================================================================
 # Tarball Listing
@@ -39,6 +55,8 @@ def list_shared_container_tars(
     List available container tarballs in a directory.
 
     Scans for files matching the pattern: {container_name}-{timestamp}.tar
+    The scan is skipped when the directory mtime shows nothing was added or
+    removed since the previous call.
 
     Args:
         container_tar_dir: Path to directory containing tarballs.
@@ -47,28 +65,42 @@ def list_shared_container_tars(
     Returns:
         List of (timestamp, filepath) tuples, sorted newest first.
     """
-    if not os.path.isdir(container_tar_dir):
+    try:
+        dir_stat = os.stat(container_tar_dir)
+    except OSError:
+        dir_stat = None
+    if dir_stat is None or not stat.S_ISDIR(dir_stat.st_mode):
         log.debug(f"Container tar directory not found: {container_tar_dir}")
         return []
 
-    pattern = re.compile(rf"^{re.escape(container_name.lower())}-(\d+)\.tar$")
+    cache_key = (container_tar_dir, container_name)
+    mtime_ns = dir_stat.st_mtime_ns
+    cached = _tar_listing_cache.get(cache_key)
+    if cached is not None and cached[0] == mtime_ns:
+        return list(cached[1])
+
+    prefix = f"{container_name.lower()}-"
+    suffix = ".tar"
     tar_files: list[tuple[int, str]] = []
 
     try:
-        for filename in os.listdir(container_tar_dir):
-            match = pattern.match(filename)
-            if match:
-                try:
-                    timestamp = int(match.group(1))
-                    tar_path = os.path.join(container_tar_dir, filename)
-                    tar_files.append((timestamp, tar_path))
-                except ValueError:
-                    log.warning(f"Skipping malformed tarball filename: {filename}")
+        with os.scandir(container_tar_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith(prefix) and name.endswith(suffix)):
+                    continue
+                stamp = name[len(prefix) : -len(suffix)]
+                if not (stamp.isascii() and stamp.isdigit()):
+                    continue
+                if entry.is_file():
+                    tar_files.append((int(stamp), entry.path))
     except OSError as e:
         log.error(f"Error listing container tars in {container_tar_dir}: {e}")
         return []
 
     tar_files.sort(key=lambda item: item[0], reverse=True)
+    if time.time_ns() - mtime_ns > TAR_LISTING_MTIME_SLACK_NS:
+        _tar_listing_cache[cache_key] = (mtime_ns, list(tar_files))
     return tar_files
 
 
@@ -89,14 +121,19 @@ def get_local_image_timestamp(container_name: str) -> int | None:
     """
     tag = image_tag(container_name)
 
+    cached = get_cached_image_timestamp(tag)
+    if cached is not None:
+        return cached
+
     try:
         client = docker.from_env(timeout=None)
         image = client.images.get(tag)
         created_str = image.attrs.get("Created")
 
         if created_str:
-            dt_obj = datetime.datetime.fromisoformat(created_str.replace("Z", "+00:00"))
-            return int(dt_obj.timestamp())
+            timestamp = parse_docker_timestamp(created_str)
+            cache_image_timestamp(tag, timestamp)
+            return timestamp
         return None
 
     except docker.errors.ImageNotFound:
@@ -178,8 +215,9 @@ def sync_from_shared(
     try:
         client = docker.from_env(timeout=None)
 
-        with open(tarball_path, "rb") as f:
+        with open_image_tarball(tarball_path) as f:
             images = client.images.load(f)
+        invalidate_image_timestamp()
 
         if not images:
             log.error(f"No images loaded from {tarball_path}")
@@ -254,6 +292,7 @@ def create_container_tar(
 
         # Commit container to image
         _commit_container(container, tag)
+        invalidate_image_timestamp(tag)
 
         # Save image to tarball
         image = client.images.get(tag)
@@ -300,12 +339,10 @@ def _commit_container(container, tag: str) -> None:
 
 def _save_image_to_tarball(image, tarball_path: str, container_tar_dir: str) -> None:
     """Save an image to a tarball file."""
-    os.makedirs(container_tar_dir, exist_ok=True)
+    ensure_tarball_dir(container_tar_dir)
 
     log.info(f"Saving image to {tarball_path}")
-    with open(tarball_path, "wb") as f:
-        for chunk in image.save(named=True):
-            f.write(chunk)
+    write_image_tarball(image, tarball_path, named=True)
 
 
 def _cleanup_old_tarballs(
@@ -18,7 +18,7 @@ import os
 from fastapi import FastAPI, Path, WebSocket
 
 from kohakuriver.db.base import db, initialize_database
-from kohakuriver.docker.client import DockerManager
+from kohakuriver.docker.client import get_docker_manager
 from kohakuriver.docker.naming import ENV_PREFIX
 from kohakuriver.host.background.health import collate_health_data
 from kohakuriver.host.background.runner_monitor import check_dead_runners
@@ -34,9 +34,11 @@ from kohakuriver.host.endpoints import (
 )
 from kohakuriver.host.endpoints.docker_terminal import terminal_websocket_endpoint
 from kohakuriver.host.endpoints.task_terminal import task_terminal_proxy_endpoint
+from kohakuriver.host.services.node_manager import rebuild_core_usage
+from kohakuriver.host.services.runner_client import close_runner_client
 from kohakuriver.models.enums import LogLevel
 from kohakuriver.ssh_proxy.server import start_server
-from kohakuriver.utils.logger import configure_logging, get_logger
+from kohakuriver.utils.logger import configure_logging, flush_logging, get_logger
 
 logger = get_logger(__name__)
 
@@ -108,6 +110,7 @@ async def startup_event():
 
     # Initialize database
     initialize_database(config.DB_FILE)
+    rebuild_core_usage()
 
     # Ensure container tar directory exists
     container_tar_dir = config.get_container_dir()
@@ -136,11 +139,14 @@ async def shutdown_event():
     if background_tasks:
         await asyncio.gather(*background_tasks, return_exceptions=True)
 
+    await close_runner_client()
+
     # Close database connection
     if not db.is_closed():
         db.close()
 
     logger.info("Host server shut down complete")
+    await flush_logging()
 
 
 # Register lifecycle handlers
@@ -215,8 +221,10 @@ async def _cleanup_broken_containers():
 
 def _do_cleanup_broken_containers():
     """Remove broken containers (blocking implementation)."""
-    docker_manager = DockerManager()
-    containers = docker_manager.list_containers(all=True)
+    docker_manager = get_docker_manager()
+    containers = docker_manager.list_containers(
+        all=True, filters={"name": f"^/{ENV_PREFIX}-"}
+    )
 
     for container in containers:
         # Only check HakuRiver environment containers
@@ -289,7 +297,7 @@ def _ensure_container_from_tarball(
     shared_tars: list[tuple[int, str]],
 ):
     """Ensure container exists, creating from tarball if needed."""
-    docker_manager = DockerManager()
+    docker_manager = get_docker_manager()
 
     # Check if container already exists (with or without prefix)
     if docker_manager.container_exists(container_name):
@@ -317,7 +325,7 @@ def _create_default_container(
     container_tar_dir: str,
 ):
     """Create the default container and export to tarball."""
-    docker_manager = DockerManager()
+    docker_manager = get_docker_manager()
 
     # Create container from base image
     docker_manager.create_container(image=base_image, name=container_name)
@@ -345,7 +353,7 @@ def run():
     import uvicorn
 
     # Configure logging before starting uvicorn
-    configure_logging(config.LOG_LEVEL)
+    configure_logging(config.LOG_LEVEL, enqueue=True)
 
     # Map log levels to uvicorn levels
     uvicorn_level_map = {
@@ -364,6 +372,9 @@ def run():
         port=config.HOST_PORT,
         log_level=uvicorn_level,
         log_config=None,  # Disable uvicorn's default logging config (use loguru)
+        # Outlive the runners' 60s pooled keep-alive; uvicorn's 5s default
+        # drops idle runner connections right at the heartbeat interval
+        timeout_keep_alive=75,
     )
 
 
@@ -8,7 +8,7 @@ Maintains a rolling 60-second history of health data.
 import asyncio
 import datetime
 
-from kohakuriver.db.node import Node
+from kohakuriver.db.node import Node, parse_gpu_info, parse_numa_topology
 from kohakuriver.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -29,8 +29,6 @@ async def collate_health_data() -> None:
     Runs every second and keeps 60 seconds of history.
     This data is used by the /health endpoint for monitoring.
     """
-    global health_datas
-
     while True:
         await asyncio.sleep(1)
 
@@ -39,7 +37,8 @@ async def collate_health_data() -> None:
             node_health["aggregate"] = aggregate
 
             health_datas.append(node_health)
-            health_datas = health_datas[-60:]  # Keep only last 60 seconds
+            # Trim in place: endpoints hold a reference to this list
+            del health_datas[:-60]  # Keep only last 60 seconds
 
         except Exception as e:
             logger.error(f"Error collecting health data: {e}")
@@ -60,9 +59,10 @@ def _collect_node_metrics() -> tuple[dict, dict]:
     node_health: dict = {}
     aggregate = _create_empty_aggregate()
 
-    for node in Node.select():
-        node_health[node.hostname] = _build_node_health(node)
-        _update_aggregate(aggregate, node)
+    # Plain dict rows: no model hydration needed for a read-only snapshot
+    for row in Node.select().dicts():
+        node_health[row["hostname"]] = _build_node_health(row)
+        _update_aggregate(aggregate, row)
 
     _finalize_aggregate(aggregate)
     return node_health, aggregate
@@ -84,52 +84,52 @@ def _create_empty_aggregate() -> dict:
     }
 
 
-def _build_node_health(node: Node) -> dict:
-    """Build health dictionary for a single node."""
+def _build_node_health(row: dict) -> dict:
+    """Build health dictionary for a single node row."""
+    last_heartbeat = row["last_heartbeat"]
     return {
-        "hostname": node.hostname,
-        "status": node.status,
-        "last_heartbeat": (
-            node.last_heartbeat.isoformat() if node.last_heartbeat else None
-        ),
-        "cpu_percent": node.cpu_percent,
-        "memory_percent": node.memory_percent,
-        "memory_used_bytes": node.memory_used_bytes,
-        "memory_total_bytes": node.memory_total_bytes,
-        "total_cores": node.total_cores,
-        "numa_topology": node.get_numa_topology(),
-        "current_avg_temp": node.current_avg_temp,
-        "current_max_temp": node.current_max_temp,
-        "gpu_info": node.get_gpu_info(),
+        "hostname": row["hostname"],
+        "status": row["status"],
+        "last_heartbeat": last_heartbeat.isoformat() if last_heartbeat else None,
+        "cpu_percent": row["cpu_percent"],
+        "memory_percent": row["memory_percent"],
+        "memory_used_bytes": row["memory_used_bytes"],
+        "memory_total_bytes": row["memory_total_bytes"],
+        "total_cores": row["total_cores"],
+        "numa_topology": parse_numa_topology(row["numa_topology"]),
+        "current_avg_temp": row["current_avg_temp"],
+        "current_max_temp": row["current_max_temp"],
+        "gpu_info": parse_gpu_info(row["gpu_info"]),
     }
 
 
-def _update_aggregate(aggregate: dict, node: Node) -> None:
-    """Update aggregate metrics with data from a node."""
+def _update_aggregate(aggregate: dict, row: dict) -> None:
+    """Update aggregate metrics with data from a node row."""
     aggregate["totalNodes"] += 1
 
-    if node.status == "online":
+    if row["status"] == "online":
         aggregate["onlineNodes"] += 1
 
-    aggregate["totalCores"] += node.total_cores or 0
-    aggregate["totalMemBytes"] += node.memory_total_bytes or 0
-    aggregate["usedMemBytes"] += node.memory_used_bytes or 0
+    total_cores = row["total_cores"] or 0
+    aggregate["totalCores"] += total_cores
+    aggregate["totalMemBytes"] += row["memory_total_bytes"] or 0
+    aggregate["usedMemBytes"] += row["memory_used_bytes"] or 0
 
     # Weight CPU percent by core count
-    aggregate["avgCpuPercent"] += (node.cpu_percent or 0) * (node.total_cores or 0)
+    aggregate["avgCpuPercent"] += (row["cpu_percent"] or 0) * total_cores
 
     # Track latest heartbeat
-    if node.last_heartbeat:
-        node_timestamp = node.last_heartbeat.isoformat()
+    if row["last_heartbeat"]:
+        node_timestamp = row["last_heartbeat"].isoformat()
         if node_timestamp > aggregate["lastUpdated"]:
             aggregate["lastUpdated"] = node_timestamp
 
     # Track max temperatures
     aggregate["maxAvgCpuTemp"] = max(
-        aggregate["maxAvgCpuTemp"], node.current_avg_temp or 0
+        aggregate["maxAvgCpuTemp"], row["current_avg_temp"] or 0
     )
     aggregate["maxMaxCpuTemp"] = max(
-        aggregate["maxMaxCpuTemp"], node.current_max_temp or 0
+        aggregate["maxMaxCpuTemp"], row["current_max_temp"] or 0
     )
 
 
@@ -6,14 +6,21 @@ Detects dead runners via heartbeat timeouts and marks their tasks as lost.
 
 import asyncio
 import datetime
+import time
 
+from kohakuriver.db.base import db
 from kohakuriver.db.node import Node
 from kohakuriver.db.task import Task
 from kohakuriver.host.config import config
+from kohakuriver.host.services.node_manager import track_task_cores
 from kohakuriver.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Monotonic time of the last heartbeat/registration seen from each node.
+# Used for timeout checks so wall-clock jumps cannot mark nodes offline.
+_last_seen: dict[str, float] = {}
+
 
 # =============================================================================
 # Background Task
@@ -30,32 +37,60 @@ async def check_dead_runners() -> None:
         await asyncio.sleep(config.CLEANUP_CHECK_INTERVAL_SECONDS)
 
         try:
-            dead_nodes = _find_dead_nodes()
+            dead_nodes = _find_dead_nodes(time.monotonic())
+            if not dead_nodes:
+                continue
 
-            for node in dead_nodes:
-                _mark_node_offline(node)
-                _mark_node_tasks_lost(node)
+            # Commit the whole tick at once instead of once per row
+            now = datetime.datetime.now()
+            with db.atomic():
+                for node in dead_nodes:
+                    _mark_node_offline(node)
+                    _mark_node_tasks_lost(node, now)
 
         except Exception as e:
             logger.error(f"Error checking dead runners: {e}")
 
 
+# =============================================================================
+# Heartbeat Tracking
+# =============================================================================
+
+
+def record_heartbeat(hostname: str) -> None:
+    """
+    Record that a node was just heard from.
+
+    Args:
+        hostname: Node that sent a heartbeat or registered.
+    """
+    _last_seen[hostname] = time.monotonic()
+
+
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
 
-def _find_dead_nodes() -> list[Node]:
-    """Find nodes that have missed their heartbeat timeout."""
-    timeout_threshold = datetime.datetime.now() - datetime.timedelta(
-        seconds=config.HEARTBEAT_INTERVAL_SECONDS * config.HEARTBEAT_TIMEOUT_FACTOR
-    )
+def _find_dead_nodes(now_monotonic: float) -> list[Node]:
+    """
+    Find nodes that have missed their heartbeat timeout.
 
-    return list(
-        Node.select().where(
-            (Node.status == "online") & (Node.last_heartbeat < timeout_threshold)
-        )
-    )
+    Online nodes not yet seen by this host process (e.g. right after a host
+    restart) start their timeout window from the first check.
+
+    Args:
+        now_monotonic: time.monotonic() value for this check.
+    """
+    timeout = config.HEARTBEAT_INTERVAL_SECONDS * config.HEARTBEAT_TIMEOUT_FACTOR
+
+    dead_nodes = []
+    for node in Node.select().where(Node.status == "online"):
+        last_seen = _last_seen.setdefault(node.hostname, now_monotonic)
+        if now_monotonic - last_seen > timeout:
+            dead_nodes.append(node)
+
+    return dead_nodes
 
 
 def _mark_node_offline(node: Node) -> None:
@@ -66,24 +101,34 @@ def _mark_node_offline(node: Node) -> None:
     )
     node.status = "offline"
     node.save()
+    _last_seen.pop(node.hostname, None)
 
 
-def _mark_node_tasks_lost(node: Node) -> None:
+def _mark_node_tasks_lost(node: Node, now: datetime.datetime) -> None:
     """Mark all running/assigning tasks on a node as lost."""
+    lost_filter = (Task.assigned_node == node.hostname) & (
+        Task.status.in_(["running", "assigning"])
+    )
     tasks_to_fail: list[Task] = list(
-        Task.select().where(
-            (Task.assigned_node == node.hostname)
-            & (Task.status.in_(["running", "assigning"]))
+        Task.select(Task.task_id, Task.assigned_node, Task.required_cores).where(
+            lost_filter
         )
     )
 
+    if not tasks_to_fail:
+        return
+
+    Task.update(
+        status="lost",
+        error_message=f"Node {node.hostname} went offline (heartbeat timeout)",
+        completed_at=now,
+        exit_code=-1,
+    ).where(lost_filter).execute()
+
     for task in tasks_to_fail:
         logger.warning(
-            f"Marking task {task.task_id} as 'lost' "
+            f"Marked task {task.task_id} as 'lost' "
             f"because node {node.hostname} went offline"
         )
         task.status = "lost"
-        task.error_message = f"Node {node.hostname} went offline (heartbeat timeout)"
-        task.completed_at = datetime.datetime.now()
-        task.exit_code = -1
-        task.save()
+        track_task_cores(task)
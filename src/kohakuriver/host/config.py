@@ -92,6 +92,15 @@ class HostConfig:
 
     LOG_LEVEL: LogLevel = LogLevel.INFO
 
+    # -------------------------------------------------------------------------
+    # Derived Value Cache
+    # -------------------------------------------------------------------------
+
+    # (SHARED_DIR, CONTAINER_DIR, resolved container dir)
+    _container_dir_cache: tuple[str, str, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     # =========================================================================
     # Helper Methods
     # =========================================================================
@@ -104,9 +113,21 @@ class HostConfig:
             Path to the directory containing container tarballs.
             Defaults to SHARED_DIR/kohakuriver-containers if not explicitly set.
         """
+        # Keyed on the inputs so config files assigning paths later still apply.
+        cached = self._container_dir_cache
+        if (
+            cached is not None
+            and cached[0] == self.SHARED_DIR
+            and cached[1] == self.CONTAINER_DIR
+        ):
+            return cached[2]
+
         if self.CONTAINER_DIR:
-            return self.CONTAINER_DIR
-        return os.path.join(self.SHARED_DIR, "kohakuriver-containers")
+            container_dir = self.CONTAINER_DIR
+        else:
+            container_dir = os.path.join(self.SHARED_DIR, "kohakuriver-containers")
+        self._container_dir_cache = (self.SHARED_DIR, self.CONTAINER_DIR, container_dir)
+        return container_dir
 
     def get_host_url(self) -> str:
         """
@@ -9,17 +9,21 @@ All Docker operations are wrapped in asyncio.to_thread to prevent blocking.
 """
 
 import asyncio
+import datetime
 import os
 import re
+import time
 from collections import defaultdict
+from operator import itemgetter
 
 import docker
 import psutil
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import FileResponse, JSONResponse, Response
 from pydantic import BaseModel
+from pydantic_core import to_json
 
-from kohakuriver.docker.client import DockerManager
+from kohakuriver.docker.client import DockerManager, get_docker_manager
 from kohakuriver.docker.naming import ENV_PREFIX
 from kohakuriver.host.config import config
 from kohakuriver.utils.logger import get_logger
@@ -27,6 +31,41 @@ from kohakuriver.utils.logger import get_logger
 logger = get_logger(__name__)
 router = APIRouter()
 
+# Tarball listings are reused while the shared directory mtime is unchanged,
+# for at most this long (sizes of a tarball still being written can change
+# without touching the directory).
+TARBALL_LIST_TTL_SECONDS = 5.0
+
+# (container_dir, dir mtime_ns, built_at monotonic, listing)
+_tarball_cache: tuple[str, int, float, dict] | None = None
+_tarball_cache_lock = asyncio.Lock()
+
+# Tarball naming pattern: {container_name}-{timestamp}.tar, where the
+# timestamp is a unix timestamp of at least 10 digits.
+_TARBALL_RE = re.compile(r"^(.+)-(\d{10,})\.tar$")
+
+# Inspect "Created" strings by container ID. Raw summaries only carry epoch
+# seconds; the inspect string never changes for a container, so each one
+# costs a single lookup the first time it is listed.
+_container_created_cache: dict[str, str] = {}
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse serialized by pydantic-core instead of json.dumps.
+
+    Returned directly from listing handlers, which also skips FastAPI's
+    jsonable_encoder pass over payloads that are already plain JSON types.
+    """
+
+    def render(self, content) -> bytes:
+        return to_json(content)
+
+
+class TarballFileResponse(FileResponse):
+    """FileResponse with a larger read size for multi-GB image tarballs."""
+
+    chunk_size = 4 * 1024 * 1024
+
 
 class CreateContainerRequest(BaseModel):
     """Request body for creating a container."""
@@ -80,45 +119,85 @@ def _resolve_container_name(docker_manager: DockerManager, env_name: str) -> str
     return None
 
 
+def _container_created(docker_manager, summary: dict) -> str | None:
+    """Get a container's creation time as the inspect "Created" string."""
+    container_id = summary["Id"]
+    created = _container_created_cache.get(container_id)
+    if created is not None:
+        return created
+
+    try:
+        created = docker_manager.client.api.inspect_container(container_id).get(
+            "Created"
+        )
+    except Exception as e:
+        logger.debug(f"Failed to inspect container {container_id[:12]}: {e}")
+        created = None
+
+    if created:
+        _container_created_cache[container_id] = created
+        return created
+
+    # Fall back to the summary's epoch seconds in the same RFC 3339 form
+    epoch = summary.get("Created")
+    if not epoch:
+        return None
+    return datetime.datetime.fromtimestamp(epoch, tz=datetime.timezone.utc).strftime(
+        "%Y-%m-%dT%H:%M:%SZ"
+    )
+
+
 def _do_list_host_containers() -> list[dict]:
     """List containers (blocking, run in executor)."""
-    docker_manager = DockerManager()
-    containers = docker_manager.list_containers(all=True)
+    docker_manager = get_docker_manager()
+    # Let the daemon drop unrelated containers; env containers carry no
+    # managed label, so match on the name prefix instead.
+    # Raw summaries plus one image listing: two daemon calls in steady state,
+    # instead of an inspect and an image lookup per container (containers
+    # not seen before get one inspect for their "Created" string).
+    containers = docker_manager.list_container_summaries(
+        all=True, filters={"name": f"^/{ENV_PREFIX}-"}
+    )
+    image_tags = docker_manager.image_tags_by_id()
+
+    # Forget containers that no longer exist
+    live_ids = {container["Id"] for container in containers}
+    for container_id in _container_created_cache.keys() - live_ids:
+        _container_created_cache.pop(container_id, None)
 
     result = []
     for container in containers:
+        names = container.get("Names") or []
+        name = names[0].lstrip("/") if names else ""
+
         # Only include HakuRiver environment containers
-        if not _is_env_container(container.name):
+        if not _is_env_container(name):
             continue
 
-        # Get image tag safely - handle missing/deleted images
-        try:
-            image = container.image
-            image_tags = image.tags if image and image.tags else []
-            image_name = (
-                image_tags[0]
-                if image_tags
-                else (image.short_id if image else "<missing>")
-            )
-        except Exception:
+        # Resolve image tag - handle missing/deleted images
+        image_id = container.get("ImageID", "")
+        if image_id in image_tags:
+            tags = image_tags[image_id]
+            image_name = tags[0] if tags else image_id[:17]
+        else:
             # Image may have been deleted
             image_name = "<missing>"
 
         result.append(
             {
-                "id": container.short_id,
-                "name": container.name,
-                "env_name": _get_env_name(container.name),
+                "id": container["Id"][:12],
+                "name": name,
+                "env_name": _get_env_name(name),
                 "image": image_name,
-                "status": container.status,
-                "created": container.attrs.get("Created"),
+                "status": container.get("State"),
+                "created": _container_created(docker_manager, container),
             }
         )
 
     return result
 
 
-@router.get("/host/containers")
+@router.get("/host/containers", response_class=FastJSONResponse)
 async def list_host_containers():
     """List HakuRiver environment containers on the Host.
 
@@ -127,7 +206,7 @@ async def list_host_containers():
     """
     try:
         result = await asyncio.to_thread(_do_list_host_containers)
-        return result
+        return FastJSONResponse(result)
 
     except Exception as e:
         logger.error(f"Error listing containers: {e}")
@@ -161,7 +240,7 @@ def _get_resource_limits() -> dict:
 
 def _do_create_host_container(image_name: str, container_name: str) -> dict:
     """Create container (blocking, run in executor)."""
-    docker_manager = DockerManager()
+    docker_manager = get_docker_manager()
 
     # Check if container already exists
     if docker_manager.container_exists(container_name):
@@ -227,7 +306,7 @@ async def create_host_container(request: CreateContainerRequest):
 
 def _do_delete_host_container(env_name: str) -> str:
     """Delete container (blocking, run in executor). Returns actual container name."""
-    docker_manager = DockerManager()
+    docker_manager = get_docker_manager()
 
     actual_name = _resolve_container_name(docker_manager, env_name)
     if not actual_name:
@@ -257,7 +336,7 @@ async def delete_host_container(env_name: str):
 
 def _do_stop_host_container(env_name: str) -> str:
     """Stop container (blocking, run in executor). Returns actual container name."""
-    docker_manager = DockerManager()
+    docker_manager = get_docker_manager()
 
     actual_name = _resolve_container_name(docker_manager, env_name)
     if not actual_name:
@@ -287,7 +366,7 @@ async def stop_host_container(env_name: str):
 
 def _do_start_host_container(env_name: str) -> str:
     """Start container (blocking, run in executor). Returns actual container name."""
-    docker_manager = DockerManager()
+    docker_manager = get_docker_manager()
 
     actual_name = _resolve_container_name(docker_manager, env_name)
     if not actual_name:
@@ -320,68 +399,106 @@ async def start_host_container(env_name: str):
 # =============================================================================
 
 
-@router.get("/list")
-async def list_tarballs():
-    """List available HakuRiver container tarballs in the shared directory.
+def _do_list_tarballs_cached(container_dir: str) -> dict:
+    """List tarballs, reusing a recent listing if the directory is unchanged."""
+    global _tarball_cache
+
+    try:
+        mtime_ns = os.stat(container_dir).st_mtime_ns
+    except OSError:
+        return {}
+
+    now = time.monotonic()
+    cached = _tarball_cache
+    if (
+        cached is not None
+        and cached[0] == container_dir
+        and cached[1] == mtime_ns
+        and now - cached[2] < TARBALL_LIST_TTL_SECONDS
+    ):
+        return cached[3]
+
+    result = _do_list_tarballs(container_dir)
+    _tarball_cache = (container_dir, mtime_ns, now, result)
+    return result
 
-    Returns:
-        Object with container names as keys, each containing:
-        - latest_timestamp: Unix timestamp of latest version
-        - latest_tarball: Filename of latest tarball
-        - all_versions: List of all versions sorted by timestamp (newest first)
-    """
-    container_dir = config.get_container_dir()
 
+def _invalidate_tarball_cache() -> None:
+    """Drop the cached tarball listing after this process changes it."""
+    global _tarball_cache
+    _tarball_cache = None
+
+
+def _do_list_tarballs(container_dir: str) -> dict:
+    """List tarballs grouped by container (blocking, run in executor)."""
     if not os.path.isdir(container_dir):
         return {}
 
     # Group tarballs by container name
     # Tarball naming pattern: {container_name}-{timestamp}.tar (dash separator, not underscore)
     # Example: python-1732570234.tar -> container_name="python", timestamp=1732570234
-    containers: dict[str, list[dict]] = defaultdict(list)
-
-    for filename in os.listdir(container_dir):
-        if not filename.endswith(".tar"):
-            continue
-
-        filepath = os.path.join(container_dir, filename)
-        stat = os.stat(filepath)
-
-        # Parse timestamp from filename: {name}-{timestamp}.tar
-        # The timestamp is always a 10-digit unix timestamp at the end before .tar
-        match = re.match(r"^(.+)-(\d{10,})\.tar$", filename)
-        if match:
-            container_name = match.group(1)
-            timestamp = int(match.group(2))
-        else:
-            # No valid timestamp pattern, skip this file
-            continue
-
-        containers[container_name].append(
-            {
-                "timestamp": timestamp,
-                "tarball": filename,
-                "size_bytes": stat.st_size,
-            }
-        )
+    # Versions are collected as (timestamp, filename, size_bytes) tuples
+    containers: dict[str, list[tuple[int, str, int]]] = defaultdict(list)
+
+    with os.scandir(container_dir) as entries:
+        for entry in entries:
+            filename = entry.name
+            if not filename.endswith(".tar"):
+                continue
+
+            # Parse timestamp from filename: {name}-{timestamp}.tar
+            # The timestamp is always a 10-digit unix timestamp at the end before .tar
+            match = _TARBALL_RE.match(filename)
+            if match:
+                container_name = match.group(1)
+                timestamp = int(match.group(2))
+            else:
+                # No valid timestamp pattern, skip this file
+                continue
+
+            # Only stat entries that matched; no path join needed.
+            containers[container_name].append(
+                (timestamp, filename, entry.stat().st_size)
+            )
 
     # Build result object with latest_timestamp, latest_tarball, all_versions
     result = {}
     for name, versions in containers.items():
         # Sort by timestamp descending (newest first)
-        versions.sort(key=lambda x: x["timestamp"], reverse=True)
+        versions.sort(key=itemgetter(0), reverse=True)
+        latest_timestamp, latest_tarball, _ = versions[0]
         result[name] = {
-            "latest_timestamp": versions[0]["timestamp"],
-            "latest_tarball": versions[0]["tarball"],
-            "all_versions": versions,
+            "latest_timestamp": latest_timestamp,
+            "latest_tarball": latest_tarball,
+            "all_versions": [
+                {"timestamp": ts, "tarball": tarball, "size_bytes": size}
+                for ts, tarball, size in versions
+            ],
         }
 
     return result
 
 
+@router.get("/list", response_class=FastJSONResponse)
+async def list_tarballs():
+    """List available HakuRiver container tarballs in the shared directory.
+
+    Returns:
+        Object with container names as keys, each containing:
+        - latest_timestamp: Unix timestamp of latest version
+        - latest_tarball: Filename of latest tarball
+        - all_versions: List of all versions sorted by timestamp (newest first)
+    """
+    container_dir = config.get_container_dir()
+    # Serialize rebuilds so concurrent polls share one directory scan.
+    async with _tarball_cache_lock:
+        result = await asyncio.to_thread(_do_list_tarballs_cached, container_dir)
+    return FastJSONResponse(result)
+
+
 def _do_create_tarball(env_name: str, container_dir: str) -> tuple[str, str]:
     """Create tarball (blocking, run in executor). Returns (actual_name, tarball_path)."""
-    docker_manager = DockerManager()
+    docker_manager = get_docker_manager()
 
     actual_name = _resolve_container_name(docker_manager, env_name)
     if not actual_name:
@@ -411,6 +528,7 @@ async def create_tarball(env_name: str):
             env_name,
             config.get_container_dir(),
         )
+        _invalidate_tarball_cache()
 
         logger.info(f"Container tarball created at {tarball_path}")
 
@@ -427,57 +545,130 @@ async def create_tarball(env_name: str):
         raise HTTPException(status_code=500, detail=f"Error creating tarball: {e}")
 
 
+def _enumerate_tarballs(
+    container_dir: str, name: str
+) -> tuple[str | None, list[tuple[int, str]]]:
+    """Find a container's tarballs in one directory pass (blocking).
+
+    Returns:
+        Tuple of (exact "{name}.tar" path or None, timestamped
+        "{name}-{timestamp}.tar" entries sorted newest first).
+    """
+    exact_name = f"{name}.tar"
+    prefix = f"{name.lower()}-"
+    exact_path = None
+    versions: list[tuple[int, str]] = []
+
+    try:
+        entries = os.scandir(container_dir)
+    except (FileNotFoundError, NotADirectoryError):
+        return None, []
+
+    with entries:
+        for entry in entries:
+            filename = entry.name
+            if filename == exact_name:
+                if entry.is_file():
+                    exact_path = entry.path
+            elif filename.startswith(prefix) and filename.endswith(".tar"):
+                stamp = filename[len(prefix) : -len(".tar")]
+                if stamp.isascii() and stamp.isdigit() and entry.is_file():
+                    versions.append((int(stamp), entry.path))
+
+    versions.sort(key=lambda item: item[0], reverse=True)
+    return exact_path, versions
+
+
 def _do_find_tarball(name: str, container_dir: str) -> str | None:
     """Find tarball path (blocking, run in executor)."""
-    # Try exact match first
-    tarball_path = os.path.join(container_dir, f"{name}.tar")
-    if os.path.exists(tarball_path):
-        return tarball_path
+    exact_path, versions = _enumerate_tarballs(container_dir, name)
+    # Exact match wins, then the latest timestamped tarball
+    if exact_path:
+        return exact_path
+    if versions:
+        return versions[0][1]
+    return None
 
-    # Try to find tarball with timestamp pattern
-    docker_manager = DockerManager()
-    tarballs = docker_manager.list_shared_tarballs(container_dir, name)
-    if tarballs:
-        return tarballs[0][1]  # Latest tarball
 
-    return None
+def _do_find_tarball_with_stat(
+    name: str, container_dir: str
+) -> tuple[str, os.stat_result] | None:
+    """Find tarball path and stat it (blocking, run in executor)."""
+    tarball_path = _do_find_tarball(name, container_dir)
+    if not tarball_path:
+        return None
+    try:
+        return tarball_path, os.stat(tarball_path)
+    except FileNotFoundError:
+        return None
 
 
-@router.get("/container/{name}")
-async def download_container(name: str):
-    """Download a container tarball."""
+def _tarball_etag(stat_result: os.stat_result) -> str:
+    """Build a strong ETag from a tarball's mtime and size."""
+    return f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+@router.api_route("/container/{name}", methods=["GET", "HEAD"])
+async def download_container(name: str, request: Request):
+    """Download a container tarball.
+
+    Responses carry an ETag derived from the tarball's mtime and size; a
+    request with a matching If-None-Match gets 304 Not Modified. HEAD returns
+    the headers only.
+    """
     container_dir = config.get_container_dir()
 
-    tarball_path = await asyncio.to_thread(_do_find_tarball, name, container_dir)
+    found = await asyncio.to_thread(_do_find_tarball_with_stat, name, container_dir)
 
-    if not tarball_path or not os.path.exists(tarball_path):
+    if not found:
         raise HTTPException(
             status_code=404,
             detail=f"Container '{name}' not found.",
         )
 
-    return FileResponse(
+    tarball_path, stat_result = found
+    etag = _tarball_etag(stat_result)
+    cache_headers = {
+        "ETag": etag,
+        "Cache-Control": "public, max-age=0, must-revalidate",
+    }
+
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=cache_headers)
+
+    # Reuse the stat from the lookup; it also supplies Content-Length.
+    return TarballFileResponse(
         path=tarball_path,
         filename=os.path.basename(tarball_path),
         media_type="application/x-tar",
+        headers=cache_headers,
+        stat_result=stat_result,
     )
 
 
 def _do_delete_tarball(name: str, container_dir: str) -> list[str]:
     """Delete tarballs (blocking, run in executor). Returns list of deleted paths."""
-    docker_manager = DockerManager()
-    tarballs = docker_manager.list_shared_tarballs(container_dir, name)
-
-    # Also check for exact match
-    exact_path = os.path.join(container_dir, f"{name}.tar")
-    if os.path.exists(exact_path):
-        tarballs.append((0, exact_path))
+    exact_path, versions = _enumerate_tarballs(container_dir, name)
+    paths = [path for _, path in versions]
+    if exact_path:
+        paths.append(exact_path)
 
-    if not tarballs:
+    if not paths:
         raise FileNotFoundError(f"Container '{name}' not found.")
 
     deleted = []
-    for _, tarball_path in tarballs:
+    for tarball_path in paths:
         os.remove(tarball_path)
         deleted.append(tarball_path)
 
@@ -491,6 +682,7 @@ async def delete_tarball(name: str):
 
     try:
         deleted = await asyncio.to_thread(_do_delete_tarball, name, container_dir)
+        _invalidate_tarball_cache()
         for path in deleted:
             logger.info(f"Deleted container tarball: {path}")
 
@@ -568,7 +760,7 @@ def _do_migrate_container(old_name: str, new_name: str) -> dict:
 
 def _check_migrate_preconditions(old_name: str, new_name: str) -> None:
     """Check migration preconditions (blocking, run in executor)."""
-    docker_manager = DockerManager()
+    docker_manager = get_docker_manager()
 
     # Check if old container exists
     if not docker_manager.container_exists(old_name):
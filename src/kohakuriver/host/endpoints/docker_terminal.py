@@ -2,6 +2,8 @@
 
 import asyncio
 import json
+import socket
+import time
 
 import docker
 from docker.errors import APIError as DockerAPIError
@@ -14,6 +16,22 @@ from kohakuriver.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Output coalescing: after the first chunk arrives, keep draining the exec
+# socket for a short window so bursts become a single WebSocket frame.
+OUTPUT_COALESCE_MAX_BYTES = 64 * 1024
+OUTPUT_COALESCE_WINDOW_SECONDS = 0.002
+
+# Output frames have a fixed shape, so they are serialized by hand instead of
+# going through WebSocketOutputMessage on every chunk.
+_OUTPUT_FRAME_PREFIX = '{"type":"output","data":'
+_encode_json_str = json.JSONEncoder(ensure_ascii=False).encode
+
+# Docker client shared by all terminal sessions, re-pinged at most this often
+DOCKER_PING_INTERVAL_SECONDS = 30.0
+_docker_client: docker.DockerClient | None = None
+_docker_client_lock = asyncio.Lock()
+_docker_last_ping = float("-inf")
+
 
 # --- WebSocket Message Models ---
 
@@ -34,6 +52,37 @@ class WebSocketOutputMessage(BaseModel):
     data: str
 
 
+async def _get_docker_client() -> docker.DockerClient:
+    """Get the shared Docker client, creating it on first use.
+
+    The daemon is pinged when the client is created and then again only
+    once DOCKER_PING_INTERVAL_SECONDS have passed. A failed ping drops the
+    client so the next session reconnects from scratch. The old client is
+    not closed here since open sessions may still be streaming through it;
+    it is released once they finish.
+
+    Raises:
+        Exception: If the client cannot be created or the daemon does not
+            answer the health check.
+    """
+    global _docker_client, _docker_last_ping
+
+    async with _docker_client_lock:
+        if _docker_client is None:
+            _docker_client = await asyncio.to_thread(docker.from_env, timeout=None)
+            _docker_last_ping = float("-inf")
+
+        if time.monotonic() - _docker_last_ping >= DOCKER_PING_INTERVAL_SECONDS:
+            try:
+                await asyncio.to_thread(_docker_client.ping)
+            except Exception:
+                _docker_client = None
+                raise
+            _docker_last_ping = time.monotonic()
+
+        return _docker_client
+
+
 def _resolve_container_name(client: docker.DockerClient, env_name: str) -> str | None:
     """Resolve environment name to actual container name.
 
@@ -57,6 +106,52 @@ def _resolve_container_name(client: docker.DockerClient, env_name: str) -> str |
     return None
 
 
+async def _recv_coalesced(
+    loop: asyncio.AbstractEventLoop, sock, view: memoryview
+) -> int:
+    """Read a burst of output from a non-blocking socket into one chunk.
+
+    Waits on the event loop for the first chunk, then drains whatever else
+    is already pending and keeps doing so until the coalescing window ends
+    or the buffer is full.
+
+    Args:
+        loop: The running event loop.
+        sock: The exec socket, in non-blocking mode.
+        view: Writable view over the connection's reusable read buffer.
+
+    Returns:
+        Number of bytes written to the start of ``view``; 0 if the socket
+        was closed before any data arrived.
+    """
+    total = await loop.sock_recv_into(sock, view)
+    if not total:
+        return 0
+
+    size = len(view)
+    deadline = loop.time() + OUTPUT_COALESCE_WINDOW_SECONDS
+    while total < size:
+        try:
+            n = sock.recv_into(view[total:])
+        except BlockingIOError:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(remaining)
+            continue
+        if not n:
+            # EOF: deliver what we have, the next read reports the close
+            break
+        total += n
+
+    return total
+
+
+def _output_frame(data: str) -> str:
+    """Serialize an output message, same wire format as WebSocketOutputMessage."""
+    return f"{_OUTPUT_FRAME_PREFIX}{_encode_json_str(data)}}}"
+
+
 async def terminal_websocket_endpoint(
     websocket: WebSocket,
     container_name: str = Path(
@@ -77,9 +172,8 @@ async def terminal_websocket_endpoint(
     try:
         # 1. Initialize Docker Client
         try:
-            client = docker.from_env(timeout=None)
-            client.ping()
-            logger.debug("Docker client initialized and connected.")
+            client = await _get_docker_client()
+            logger.debug("Docker client ready.")
         except Exception as e:
             logger.error(f"Failed to initialize Docker client: {e}")
             await websocket.send_json(
@@ -194,12 +288,15 @@ async def terminal_websocket_endpoint(
             raise RuntimeError("Failed to get raw socket from exec_start")
 
         raw_socket = socket_stream._sock
-        # Set socket timeout so recv() doesn't block forever
-        # This allows the thread to check for cancellation periodically
-        raw_socket.settimeout(1.0)
-        logger.debug(
-            f"Socket timeout set to 1.0s for container '{actual_container_name}' (enables clean shutdown)."
-        )
+        # Plain sockets (unix, tcp) are driven from the event loop. TLS and
+        # ssh:// transports are not accepted by the loop's sock_* API, so
+        # they keep blocking I/O in worker threads, with a timeout so reads
+        # notice shutdown.
+        use_loop_io = type(raw_socket) is socket.socket
+        if use_loop_io:
+            raw_socket.setblocking(False)
+        else:
+            raw_socket.settimeout(1.0)
         logger.info(
             f"Exec instance started, socket obtained for container '{actual_container_name}'."
         )
@@ -225,9 +322,7 @@ async def terminal_websocket_endpoint(
         except Exception as e:
             logger.debug(f"Error processing initial resize: {e}")
 
-        await websocket.send_json(
-            WebSocketOutputMessage(type="output", data="").model_dump()
-        )
+        await websocket.send_text(_output_frame(""))
 
         # 6. Define I/O handling coroutines
         # Flag to signal output task to stop
@@ -235,21 +330,28 @@ async def terminal_websocket_endpoint(
 
         async def handle_output():
             """Reads from container socket and sends to WebSocket."""
+            # One read buffer per connection, reused for every chunk
+            read_view = memoryview(bytearray(OUTPUT_COALESCE_MAX_BYTES))
+            loop = asyncio.get_running_loop()
             while not stop_output.is_set():
                 try:
-                    output = await asyncio.to_thread(raw_socket.recv, 4096)
+                    if use_loop_io:
+                        n = await _recv_coalesced(loop, raw_socket, read_view)
+                        output = read_view[:n]
+                    else:
+                        output = await asyncio.to_thread(
+                            raw_socket.recv, OUTPUT_COALESCE_MAX_BYTES
+                        )
                     if not output:
                         logger.info(
                             f"Container socket closed (output) for '{actual_container_name}'."
                         )
                         break
-                    await websocket.send_json(
-                        WebSocketOutputMessage(
-                            type="output", data=output.decode("utf-8", errors="replace")
-                        ).model_dump()
+                    await websocket.send_text(
+                        _output_frame(str(output, "utf-8", "replace"))
                     )
                 except TimeoutError:
-                    # Socket timeout - check if we should stop and continue
+                    # Threaded path only: recv timed out, check for shutdown
                     continue
                 except OSError as e:
                     # Socket closed or other OS error (includes BrokenPipeError)
@@ -279,6 +381,7 @@ async def terminal_websocket_endpoint(
 
         async def handle_input():
             """Reads from WebSocket and sends to container socket."""
+            loop = asyncio.get_running_loop()
             while True:
                 try:
                     message_text = await websocket.receive_text()
@@ -286,9 +389,12 @@ async def terminal_websocket_endpoint(
                     input_msg = WebSocketInputMessage(**message_data)
 
                     if input_msg.type == "input" and input_msg.data:
-                        await asyncio.to_thread(
-                            raw_socket.sendall, input_msg.data.encode("utf-8")
-                        )
+                        data = input_msg.data.encode("utf-8")
+                        if use_loop_io:
+                            # Sends inline, only waits for writability on a full buffer
+                            await loop.sock_sendall(raw_socket, data)
+                        else:
+                            await asyncio.to_thread(raw_socket.sendall, data)
                     elif (
                         input_msg.type == "resize" and input_msg.rows and input_msg.cols
                     ):
@@ -336,23 +442,14 @@ async def terminal_websocket_endpoint(
             [input_task, output_task], return_when=asyncio.FIRST_COMPLETED
         )
 
-        # Signal stop and close socket BEFORE cancelling tasks
-        # This allows the blocking recv() to exit gracefully
+        # Signal stop and cancel the remaining task. On the event-loop path
+        # cancellation is immediate and unregisters the socket from the loop;
+        # a threaded read ends within its socket timeout. The socket itself
+        # is closed in `finally`.
         logger.debug(
             f"Signaling terminal shutdown for container '{actual_container_name}'."
         )
         stop_output.set()
-        if socket_stream and hasattr(socket_stream, "_sock") and socket_stream._sock:
-            try:
-                socket_stream._sock.close()
-                logger.debug(
-                    f"Closed exec socket early for clean task cancellation (container '{actual_container_name}')."
-                )
-            except Exception as e:
-                logger.debug(
-                    f"Error closing exec socket early for container '{actual_container_name}': {e}"
-                )
-
         for task in pending:
             task.cancel()
         # Wait for all cancelled tasks to complete, ignoring their exceptions
@@ -23,6 +23,7 @@ from pydantic import BaseModel
 
 from kohakuriver.db.node import Node
 from kohakuriver.db.task import Task
+from kohakuriver.host.services.runner_client import get_runner_client
 from kohakuriver.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -131,15 +132,15 @@ async def _proxy_get(
     logger.debug(f"Proxying GET to {url}")
 
     try:
-        async with httpx.AsyncClient(timeout=PROXY_TIMEOUT) as client:
-            response = await client.get(url)
-
-            return Response(
-                content=response.content,
-                status_code=response.status_code,
-                headers=dict(response.headers),
-                media_type=response.headers.get("content-type"),
-            )
+        client = get_runner_client()
+        response = await client.get(url, timeout=PROXY_TIMEOUT)
+
+        return Response(
+            content=response.content,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            media_type=response.headers.get("content-type"),
+        )
     except httpx.RequestError as e:
         logger.error(f"Failed to proxy request to runner: {e}")
         raise HTTPException(status_code=502, detail=f"Failed to connect to runner: {e}")
@@ -156,15 +157,15 @@ async def _proxy_post(
     logger.debug(f"Proxying POST to {url}")
 
     try:
-        async with httpx.AsyncClient(timeout=PROXY_TIMEOUT) as client:
-            response = await client.post(url, json=json_body)
-
-            return Response(
-                content=response.content,
-                status_code=response.status_code,
-                headers=dict(response.headers),
-                media_type=response.headers.get("content-type"),
-            )
+        client = get_runner_client()
+        response = await client.post(url, json=json_body, timeout=PROXY_TIMEOUT)
+
+        return Response(
+            content=response.content,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            media_type=response.headers.get("content-type"),
+        )
     except httpx.RequestError as e:
         logger.error(f"Failed to proxy request to runner: {e}")
         raise HTTPException(status_code=502, detail=f"Failed to connect to runner: {e}")
@@ -183,15 +184,15 @@ async def _proxy_delete(
     logger.debug(f"Proxying DELETE to {url}")
 
     try:
-        async with httpx.AsyncClient(timeout=PROXY_TIMEOUT) as client:
-            response = await client.delete(url)
-
-            return Response(
-                content=response.content,
-                status_code=response.status_code,
-                headers=dict(response.headers),
-                media_type=response.headers.get("content-type"),
-            )
+        client = get_runner_client()
+        response = await client.delete(url, timeout=PROXY_TIMEOUT)
+
+        return Response(
+            content=response.content,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            media_type=response.headers.get("content-type"),
+        )
     except httpx.RequestError as e:
         logger.error(f"Failed to proxy request to runner: {e}")
         raise HTTPException(status_code=502, detail=f"Failed to connect to runner: {e}")
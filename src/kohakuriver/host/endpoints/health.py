@@ -5,7 +5,11 @@ Provides cluster health metrics and historical data.
 Returns aggregated health information from all nodes.
 """
 
+import json
+from collections.abc import AsyncIterator
+
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
 from kohakuriver.host.background.health import health_datas
 from kohakuriver.utils.logger import get_logger
@@ -51,13 +55,11 @@ async def get_cluster_health(
                 detail=f"Node {hostname} not found in health data.",
             )
 
-        return {
-            "nodes": [
-                [v for k, v in data.items() if k != "aggregate"]
-                for data in health_datas
-            ],
-            "aggregate": [data.get("aggregate", {}) for data in health_datas],
-        }
+        # Copy the list of references so the stream sees a consistent history
+        return StreamingResponse(
+            _stream_health_history(list(health_datas)),
+            media_type="application/json",
+        )
 
     except HTTPException:
         raise
@@ -67,3 +69,46 @@ async def get_cluster_health(
             status_code=500,
             detail="Error fetching health data.",
         )
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+
+def _dumps(value) -> bytes:
+    """Serialize a value to compact JSON bytes.
+
+    NaN and Infinity are rejected, as JSONResponse does, rather than
+    emitted as invalid JSON.
+    """
+    return json.dumps(value, separators=(",", ":"), allow_nan=False).encode()
+
+
+async def _stream_health_history(history: list[dict]) -> AsyncIterator[bytes]:
+    """
+    Stream the health history as a JSON object, one snapshot at a time.
+
+    Yields the same document as ``{"nodes": [...], "aggregate": [...]}``
+    without building the full payload in memory first. Async because it
+    does no blocking I/O; a sync generator would cost a threadpool hop
+    per chunk.
+
+    Args:
+        history: Per-second health snapshots, oldest first.
+    """
+    if not history:
+        yield b'{"nodes":[],"aggregate":[]}'
+        return
+
+    prefix = b'{"nodes":['
+    for data in history:
+        yield prefix + _dumps([v for k, v in data.items() if k != "aggregate"])
+        prefix = b","
+
+    prefix = b'],"aggregate":['
+    for data in history:
+        yield prefix + _dumps(data.get("aggregate", {}))
+        prefix = b","
+
+    yield b"]}"
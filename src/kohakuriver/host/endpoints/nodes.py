@@ -9,11 +9,16 @@ import datetime
 import json
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import JSONResponse
 
 from kohakuriver.db.node import Node
 from kohakuriver.db.task import Task
+from kohakuriver.host.background.runner_monitor import record_heartbeat
 from kohakuriver.host.config import config
-from kohakuriver.host.services.node_manager import get_all_nodes_status
+from kohakuriver.host.services.node_manager import (
+    get_all_nodes_status,
+    track_task_cores,
+)
 from kohakuriver.models.requests import HeartbeatRequest, RegisterRequest
 from kohakuriver.utils.logger import get_logger
 
@@ -21,6 +26,10 @@ logger = get_logger(__name__)
 
 router = APIRouter()
 
+# Last running task list reported by each runner. Runners omit the list
+# from heartbeats while it is unchanged.
+_last_running_tasks: dict[str, list[int]] = {}
+
 
 # =============================================================================
 # Node Registration
@@ -71,6 +80,9 @@ async def register_node(request: RegisterRequest):
     else:
         logger.info(f"Created new node: {hostname}")
 
+    record_heartbeat(hostname)
+    _last_running_tasks.pop(hostname, None)
+
     return {
         "message": f"Node {hostname} registered successfully.",
         "created": created,
@@ -99,13 +111,23 @@ async def heartbeat(hostname: str, request: HeartbeatRequest):
         )
 
     now = datetime.datetime.now()
+    record_heartbeat(hostname)
 
     # Update heartbeat timestamp and metrics
     _update_node_metrics(node, request, now)
 
     # Process task reconciliation
     _process_killed_tasks(request.killed_tasks, hostname, now)
-    _reconcile_assigning_tasks(request.running_tasks, hostname, now)
+
+    running_tasks = request.running_tasks
+    if running_tasks is None:
+        # Unchanged since last sent; unknown until the next full list
+        # if the host restarted in between
+        running_tasks = _last_running_tasks.get(hostname)
+    else:
+        _last_running_tasks[hostname] = running_tasks
+    if running_tasks is not None:
+        _reconcile_assigning_tasks(running_tasks, hostname, now)
 
     return {"message": "Heartbeat received"}
 
@@ -176,6 +198,7 @@ def _process_killed_tasks(
         task.error_message = f"Killed by runner: {killed_info.reason}"
         task.completed_at = now
         task.save()
+        track_task_cores(task)
 
         logger.warning(
             f"Task {killed_info.task_id} on {hostname} marked as '{new_status}' "
@@ -254,6 +277,7 @@ def _check_task_assignment_timeout(
         task.completed_at = now
         task.exit_code = -1
         task.save()
+        track_task_cores(task)
         logger.error(
             f"Task {task.task_id} (on {hostname}) failed assignment. "
             f"Marked as failed (suspect count: {task.assignment_suspicion_count})"
@@ -268,4 +292,5 @@ def _check_task_assignment_timeout(
 @router.get("/nodes")
 async def get_nodes_status():
     """Get status of all registered nodes."""
-    return get_all_nodes_status()
+    # Rows are already JSON-native; skip FastAPI's jsonable_encoder pass
+    return JSONResponse(get_all_nodes_status())
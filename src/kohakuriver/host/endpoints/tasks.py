@@ -9,13 +9,16 @@ This module provides API endpoints for task lifecycle management including:
 """
 
 import asyncio
+import codecs
 import datetime
+import io
 import json
 import os
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import PlainTextResponse, StreamingResponse
 
+from kohakuriver.db.base import db
 from kohakuriver.db.node import Node
 from kohakuriver.db.task import Task
 from kohakuriver.docker.naming import task_container_name, vps_container_name
@@ -25,17 +28,23 @@ from kohakuriver.host.services.node_manager import (
     get_node_available_cores,
     get_node_available_gpus,
     get_node_available_memory,
+    rebuild_core_usage,
+    track_task_cores,
 )
 from kohakuriver.host.services.task_scheduler import (
     mark_task_killed,
-    send_kill_to_runner,
+    send_kill_to_runner_gated,
     send_pause_to_runner,
     send_resume_to_runner,
     send_task_to_runner,
     send_vps_task_to_runner,
     update_task_status,
 )
-from kohakuriver.models.requests import TaskStatusUpdate, TaskSubmission
+from kohakuriver.models.requests import (
+    TaskStatusUpdate,
+    TaskStatusUpdateBatch,
+    TaskSubmission,
+)
 from kohakuriver.utils.logger import get_logger
 from kohakuriver.utils.snowflake import generate_snowflake_id
 
@@ -51,6 +60,15 @@ router = APIRouter()
 # Background tasks tracking
 background_tasks: set[asyncio.Task] = set()
 
+# Block size for reading task logs backwards when only the tail is wanted
+TAIL_READ_BLOCK_SIZE = 64 * 1024
+
+# Chunk size for streaming a whole task log
+OUTPUT_STREAM_CHUNK_SIZE = 256 * 1024
+
+# Task output root directories already created by this process
+_ensured_output_dirs: set[str] = set()
+
 
 # =============================================================================
 # SSH Port Allocation
@@ -374,7 +392,9 @@ def _create_task_record(
 ) -> Task | None:
     """Create task record in database."""
     output_dir = task_config["output_dir"]
-    os.makedirs(output_dir, exist_ok=True)
+    if output_dir not in _ensured_output_dirs:
+        os.makedirs(output_dir, exist_ok=True)
+        _ensured_output_dirs.add(output_dir)
 
     task_log_dir = os.path.join(output_dir, str(task_id))
     stdout_path = os.path.join(task_log_dir, "stdout.log")
@@ -383,7 +403,7 @@ def _create_task_record(
     ssh_port = allocate_ssh_port() if req.task_type == "vps" else None
 
     try:
-        return Task.create(
+        task = Task.create(
             task_id=task_id,
             task_type=req.task_type,
             batch_id=batch_id,
@@ -411,6 +431,9 @@ def _create_task_record(
         logger.exception(f"Failed to create task record: {e}")
         return None
 
+    track_task_cores(task)
+    return task
+
 
 async def _dispatch_task(
     task: Task,
@@ -431,6 +454,7 @@ async def _dispatch_task(
             task.error_message = "Failed to create VPS on runner."
             task.completed_at = datetime.datetime.now()
             task.save()
+            track_task_cores(task)
             return False
         return result
     else:
@@ -517,6 +541,53 @@ async def update_task_status_endpoint(update: TaskStatusUpdate):
     return {"message": "Task status updated successfully."}
 
 
+@router.post("/updates")
+async def update_task_status_batch_endpoint(batch: TaskStatusUpdateBatch):
+    """
+    Receive a batch of task status updates from a runner.
+
+    Updates are applied in order within a single transaction, each in its
+    own savepoint so that one failing update does not roll back the rest.
+    """
+    logger.info(f"Received {len(batch.updates)} batched status updates")
+
+    updated = 0
+    failed: list[int] = []
+    try:
+        with db.atomic():
+            for update in batch.updates:
+                logger.debug(f"Batched update: {update.model_dump()}")
+                try:
+                    with db.atomic():
+                        updated += update_task_status(
+                            task_id=update.task_id,
+                            status=update.status,
+                            exit_code=update.exit_code,
+                            message=update.message,
+                            started_at=update.started_at,
+                            completed_at=update.completed_at,
+                            ssh_port=update.ssh_port,
+                        )
+                except Exception as e:
+                    logger.exception(
+                        f"Failed to apply batched update for task {update.task_id}: {e}"
+                    )
+                    failed.append(update.task_id)
+    except Exception:
+        # Core tracking is in memory and was not rolled back with the DB
+        rebuild_core_usage()
+        raise
+
+    if failed:
+        rebuild_core_usage()
+
+    return {
+        "message": f"Updated {updated} of {len(batch.updates)} tasks.",
+        "updated": updated,
+        "failed": failed,
+    }
+
+
 # =============================================================================
 # Task Queries
 # =============================================================================
@@ -608,7 +679,7 @@ async def request_kill_task(task_id: int):
         if node and node.status == "online":
             logger.debug(f"Sending kill to runner {node.hostname} for task {task_id}")
             kill_task = asyncio.create_task(
-                send_kill_to_runner(node.url, task_id, container_name)
+                send_kill_to_runner_gated(node.url, task_id, container_name)
             )
             background_tasks.add(kill_task)
             kill_task.add_done_callback(background_tasks.discard)
@@ -650,6 +721,7 @@ async def send_command_to_task(task_id: int, command: str):
             if "successfully" in response:
                 task.status = "paused"
                 task.save()
+                track_task_cores(task)
             return {"message": f"Pause for task {task_id}: {response}"}
 
         case ("resume", "paused"):
@@ -657,6 +729,7 @@ async def send_command_to_task(task_id: int, command: str):
             if "successfully" in response:
                 task.status = "running"
                 task.save()
+                track_task_cores(task)
             return {"message": f"Resume for task {task_id}: {response}"}
 
         case _:
@@ -701,7 +774,92 @@ async def get_task_stderr(task_id: int, lines: int | None = None):
     return await _get_task_output(task_id, "stderr", lines)
 
 
-async def _get_task_output(task_id: int, output_type: str, lines: int | None) -> str:
+def _read_tail_lines(path: str, lines: int) -> str:
+    """
+    Read the last lines of a text file without reading the whole file.
+
+    Args:
+        path: File path.
+        lines: Number of lines to return (must be positive).
+
+    Returns:
+        The last lines, with line endings normalized to newlines.
+    """
+    blocks: list[bytes] = []
+    newlines = 0
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        # One extra newline guarantees the first wanted line is complete
+        while pos > 0 and newlines <= lines:
+            step = min(TAIL_READ_BLOCK_SIZE, pos)
+            pos -= step
+            f.seek(pos)
+            block = f.read(step)
+            blocks.append(block)
+            newlines += block.count(b"\n")
+
+    text = b"".join(reversed(blocks)).decode("utf-8", errors="replace")
+    return "".join(io.StringIO(text, newline=None).readlines()[-lines:])
+
+
+def _read_lines_after(path: str, skip: int) -> str:
+    """
+    Read a text file without its first lines.
+
+    Keeps the historical ``lines < 0`` behaviour of the output endpoints,
+    where ``readlines()[-lines:]`` dropped the first ``-lines`` lines.
+
+    Args:
+        path: File path.
+        skip: Number of leading lines to drop.
+
+    Returns:
+        The remaining lines, with line endings normalized to newlines.
+    """
+    with open(path, encoding="utf-8", errors="replace") as f:
+        return "".join(f.readlines()[skip:])
+
+
+async def _stream_log_snapshot(path: str):
+    """
+    Stream a text file as it was when streaming started.
+
+    Task logs may still be growing; reading stops at the size seen on open
+    so the response has a consistent end. Line endings are normalized to
+    newlines, matching _read_tail_lines.
+
+    Args:
+        path: File path.
+
+    Yields:
+        Decoded text chunks.
+    """
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder("utf-8")(errors="replace"), translate=True
+    )
+    f = await asyncio.to_thread(open, path, "rb")
+    try:
+        remaining = os.fstat(f.fileno()).st_size
+        while remaining > 0:
+            chunk = await asyncio.to_thread(
+                f.read, min(OUTPUT_STREAM_CHUNK_SIZE, remaining)
+            )
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+    finally:
+        f.close()
+
+
+async def _get_task_output(
+    task_id: int, output_type: str, lines: int | None
+) -> str | StreamingResponse:
     """Helper to get task stdout or stderr."""
     task = Task.get_or_none(Task.task_id == task_id)
     if not task:
@@ -720,13 +878,18 @@ async def _get_task_output(task_id: int, output_type: str, lines: int | None) ->
         logger.warning(f"{output_type} file not found: {output_path}")
         return ""
 
+    if not lines:
+        # Stream the file in chunks instead of loading it into memory
+        return StreamingResponse(
+            _stream_log_snapshot(output_path),
+            media_type="text/plain; charset=utf-8",
+        )
+
     try:
-        with open(output_path) as f:
-            if lines is not None:
-                content = f.readlines()[-lines:]
-                result = "".join(content)
-            else:
-                result = f.read()
+        if lines > 0:
+            result = await asyncio.to_thread(_read_tail_lines, output_path, lines)
+        else:
+            result = await asyncio.to_thread(_read_lines_after, output_path, -lines)
         logger.info(f"{output_type} for task {task_id}: {len(result)} chars")
         return result
     except Exception as e:
@@ -25,8 +25,15 @@ from kohakuriver.db.node import Node
 from kohakuriver.db.task import Task
 from kohakuriver.docker.naming import vps_container_name
 from kohakuriver.host.config import config
-from kohakuriver.host.services.node_manager import find_suitable_node
-from kohakuriver.host.services.task_scheduler import send_kill_to_runner
+from kohakuriver.host.services.node_manager import (
+    find_suitable_node,
+    track_task_cores,
+)
+from kohakuriver.host.services.runner_client import get_runner_client
+from kohakuriver.host.services.task_scheduler import (
+    send_kill_to_runner,
+    send_kill_to_runner_gated,
+)
 from kohakuriver.models.requests import VPSSubmission
 from kohakuriver.utils.logger import get_logger
 from kohakuriver.utils.snowflake import generate_snowflake_id
@@ -120,14 +127,14 @@ async def send_vps_to_runner(
     )
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{runner_url}/vps/create",
-                json=payload,
-                timeout=None,  # No timeout - VPS creation can take a long time
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_runner_client()
+        response = await client.post(
+            f"{runner_url}/vps/create",
+            json=payload,
+            timeout=None,  # No timeout - VPS creation can take a long time
+        )
+        response.raise_for_status()
+        return response.json()
 
     except httpx.RequestError as e:
         logger.error(f"Failed to send VPS {task.task_id} to {runner_url}: {e}")
@@ -261,6 +268,7 @@ async def submit_vps(submission: VPSSubmission):
         ssh_port=ssh_port,
         submitted_at=datetime.datetime.now(),
     )
+    track_task_cores(task)
 
     logger.info(f"Created VPS task {task_id} assigned to {node.hostname}")
 
@@ -279,6 +287,7 @@ async def submit_vps(submission: VPSSubmission):
         task.error_message = "Runner rejected VPS creation."
         task.completed_at = datetime.datetime.now()
         task.save()
+        track_task_cores(task)
         raise HTTPException(
             status_code=502,
             detail="Runner rejected VPS creation.",
@@ -458,6 +467,7 @@ async def stop_vps(task_id: int):
     task.error_message = "Stopped by user."
     task.completed_at = datetime.datetime.now()
     task.save()
+    track_task_cores(task)
     logger.info(f"Marked VPS {task_id} as 'stopped'.")
 
     # Tell runner to stop the VPS container
@@ -468,7 +478,7 @@ async def stop_vps(task_id: int):
                 f"Requesting stop from runner {node.hostname} " f"for VPS {task_id}"
             )
             stop_task = asyncio.create_task(
-                send_kill_to_runner(node.url, task_id, container_name)
+                send_kill_to_runner_gated(node.url, task_id, container_name)
             )
             background_tasks.add(stop_task)
             stop_task.add_done_callback(background_tasks.discard)
@@ -534,6 +544,7 @@ async def restart_vps(task_id: int):
     task.started_at = None
     task.completed_at = None
     task.save()
+    track_task_cores(task)
 
     # Step 3: Re-send VPS creation request to runner
     # We need to get the container name from the original task
@@ -553,6 +564,7 @@ async def restart_vps(task_id: int):
         task.error_message = "Runner rejected VPS restart."
         task.completed_at = datetime.datetime.now()
         task.save()
+        track_task_cores(task)
         raise HTTPException(
             status_code=502,
             detail="Runner rejected VPS restart.",
@@ -628,13 +640,13 @@ async def list_vps_snapshots(task_id: int):
     task, runner_url = await _get_vps_runner_url(task_id)
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{runner_url}/vps/snapshots/{task_id}",
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_runner_client()
+        response = await client.get(
+            f"{runner_url}/vps/snapshots/{task_id}",
+            timeout=30.0,
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.RequestError as e:
         logger.error(f"Failed to list snapshots for VPS {task_id}: {e}")
         raise HTTPException(
@@ -669,14 +681,14 @@ async def create_vps_snapshot(task_id: int, message: str = None):
 
     try:
         payload = {"message": message} if message else {}
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{runner_url}/vps/snapshots/{task_id}",
-                json=payload,
-                timeout=120.0,  # Snapshots can take time
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_runner_client()
+        response = await client.post(
+            f"{runner_url}/vps/snapshots/{task_id}",
+            json=payload,
+            timeout=120.0,  # Snapshots can take time
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.RequestError as e:
         logger.error(f"Failed to create snapshot for VPS {task_id}: {e}")
         raise HTTPException(
@@ -702,13 +714,13 @@ async def delete_vps_snapshot(task_id: int, timestamp: int):
     task, runner_url = await _get_vps_runner_url(task_id)
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"{runner_url}/vps/snapshots/{task_id}/{timestamp}",
-                timeout=60.0,
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_runner_client()
+        response = await client.delete(
+            f"{runner_url}/vps/snapshots/{task_id}/{timestamp}",
+            timeout=60.0,
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.RequestError as e:
         logger.error(f"Failed to delete snapshot for VPS {task_id}: {e}")
         raise HTTPException(
@@ -734,13 +746,13 @@ async def delete_all_vps_snapshots(task_id: int):
     task, runner_url = await _get_vps_runner_url(task_id)
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"{runner_url}/vps/snapshots/{task_id}",
-                timeout=120.0,  # Multiple deletions may take time
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_runner_client()
+        response = await client.delete(
+            f"{runner_url}/vps/snapshots/{task_id}",
+            timeout=120.0,  # Multiple deletions may take time
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.RequestError as e:
         logger.error(f"Failed to delete snapshots for VPS {task_id}: {e}")
         raise HTTPException(
@@ -766,13 +778,13 @@ async def get_latest_vps_snapshot(task_id: int):
     task, runner_url = await _get_vps_runner_url(task_id)
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{runner_url}/vps/snapshots/{task_id}/latest",
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_runner_client()
+        response = await client.get(
+            f"{runner_url}/vps/snapshots/{task_id}/latest",
+            timeout=30.0,
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.RequestError as e:
         logger.error(f"Failed to get latest snapshot for VPS {task_id}: {e}")
         raise HTTPException(
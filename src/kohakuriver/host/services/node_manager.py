@@ -5,16 +5,83 @@ Handles node resource calculations and scheduling queries.
 """
 
 import json
-from collections import defaultdict
+import threading
+from collections import Counter
 
 import peewee
 
-from kohakuriver.db.node import Node
+from kohakuriver.db.node import Node, parse_gpu_info, parse_numa_topology
 from kohakuriver.db.task import Task
 from kohakuriver.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Task states that hold cores on their assigned node
+CORE_HOLDING_STATES = ("running", "assigning")
+
+
+# =============================================================================
+# Core Usage Tracking
+# =============================================================================
+
+# Cores in use per node, kept in sync at task state transitions so that
+# status queries never need to aggregate over the Task table.
+core_usage: Counter[str] = Counter()
+
+# task_id -> (hostname, cores) for every task currently holding cores
+_task_cores: dict[int, tuple[str, int]] = {}
+_core_usage_lock = threading.Lock()
+
+
+def track_task_cores(task: Task) -> None:
+    """
+    Sync the core usage counter with a task's current state.
+
+    Call after any change to a task's status or assignment. Idempotent:
+    a task is counted at most once no matter how often it is tracked.
+
+    Args:
+        task: Task whose status/assigned_node was just updated.
+    """
+    holds_cores = task.status in CORE_HOLDING_STATES and task.assigned_node
+    with _core_usage_lock:
+        previous = _task_cores.pop(task.task_id, None)
+        if previous is not None:
+            hostname, cores = previous
+            core_usage[hostname] -= cores
+            if core_usage[hostname] <= 0:
+                del core_usage[hostname]
+        if holds_cores:
+            cores = task.required_cores or 0
+            _task_cores[task.task_id] = (task.assigned_node, cores)
+            core_usage[task.assigned_node] += cores
+
+
+def rebuild_core_usage() -> None:
+    """
+    Rebuild the core usage counter from the database.
+
+    Called once at startup; afterwards the counter is maintained
+    incrementally via track_task_cores().
+    """
+    rows = Task.select(Task.task_id, Task.assigned_node, Task.required_cores).where(
+        (Task.status.in_(CORE_HOLDING_STATES)) & (Task.assigned_node.is_null(False))
+    )
+
+    with _core_usage_lock:
+        _task_cores.clear()
+        core_usage.clear()
+        for task_id, hostname, cores in rows.tuples():
+            _task_cores[task_id] = (hostname, cores or 0)
+            core_usage[hostname] += cores or 0
+
+    logger.debug(f"Rebuilt core usage for {len(core_usage)} nodes")
+
+
+def get_cores_in_use(hostname: str) -> int:
+    """Get the number of cores held by running/assigning tasks on a node."""
+    return core_usage.get(hostname, 0)
+
 
 # =============================================================================
 # Resource Calculations
@@ -31,16 +98,7 @@ def get_node_available_cores(node: Node) -> int:
     Returns:
         Number of available cores (total - running tasks).
     """
-    running_cores = (
-        Task.select(peewee.fn.SUM(Task.required_cores))
-        .where(
-            (Task.assigned_node == node.hostname)
-            & (Task.status.in_(["running", "assigning"]))
-        )
-        .scalar()
-    )
-    used = running_cores or 0
-    return node.total_cores - used
+    return node.total_cores - get_cores_in_use(node.hostname)
 
 
 def get_node_available_gpus(node: Node) -> set[int]:
@@ -217,67 +275,46 @@ def get_all_nodes_status() -> list[dict]:
     Get status of all nodes with resource usage.
 
     Returns:
-        List of node status dictionaries.
+        List of node status dictionaries, in database order.
     """
-    nodes: list[Node] = list(Node.select())
-    cores_in_use = _calculate_cores_in_use(nodes)
-
-    return [_build_node_status(node, cores_in_use) for node in nodes]
-
-
-def _calculate_cores_in_use(nodes: list[Node]) -> dict[str, int]:
-    """Calculate cores in use for all online nodes."""
-    online_hostnames = [n.hostname for n in nodes if n.status == "online"]
-
-    if not online_hostnames:
-        return {}
-
-    cores_in_use: dict[str, int] = defaultdict(int)
-
-    running_tasks_usage = (
-        Task.select(
-            Task.assigned_node,
-            peewee.fn.SUM(Task.required_cores).alias("used_cores"),
-        )
-        .where(
-            (Task.status.in_(["running", "assigning"]))
-            & (Task.assigned_node << online_hostnames)
+    return [
+        (
+            _build_online_node_status(row)
+            if row["status"] == "online"
+            else _build_offline_node_status(row)
         )
-        .group_by(Task.assigned_node)
-    )
+        for row in Node.select().dicts()
+    ]
 
-    for usage in running_tasks_usage:
-        if usage.assigned_node:
-            cores_in_use[usage.assigned_node] = usage.used_cores or 0
 
-    return cores_in_use
+def _build_online_node_status(row: dict) -> dict:
+    """Build status dictionary for an online node row."""
+    used = core_usage.get(row["hostname"], 0)
+    return _build_node_status(row, used, row["total_cores"] - used)
 
 
-def _build_node_status(node: Node, cores_in_use: dict[str, int]) -> dict:
-    """Build status dictionary for a single node."""
-    available = 0
-    used = "N/A"
+def _build_offline_node_status(row: dict) -> dict:
+    """Build status dictionary for an offline node row."""
+    return _build_node_status(row, "N/A", 0)
 
-    if node.status == "online":
-        used = cores_in_use.get(node.hostname, 0)
-        available = node.total_cores - used
 
+def _build_node_status(row: dict, cores_in_use: int | str, available: int) -> dict:
+    """Build status dictionary for a single node row."""
+    last_heartbeat = row["last_heartbeat"]
     return {
-        "hostname": node.hostname,
-        "url": node.url,
-        "total_cores": node.total_cores,
-        "cores_in_use": used,
+        "hostname": row["hostname"],
+        "url": row["url"],
+        "total_cores": row["total_cores"],
+        "cores_in_use": cores_in_use,
         "available_cores": available,
-        "status": node.status,
-        "last_heartbeat": (
-            node.last_heartbeat.isoformat() if node.last_heartbeat else None
-        ),
-        "numa_topology": node.get_numa_topology(),
-        "gpu_info": node.get_gpu_info(),
-        "cpu_percent": node.cpu_percent,
-        "memory_percent": node.memory_percent,
-        "memory_used_bytes": node.memory_used_bytes,
-        "memory_total_bytes": node.memory_total_bytes,
-        "current_avg_temp": node.current_avg_temp,
-        "current_max_temp": node.current_max_temp,
+        "status": row["status"],
+        "last_heartbeat": last_heartbeat.isoformat() if last_heartbeat else None,
+        "numa_topology": parse_numa_topology(row["numa_topology"]),
+        "gpu_info": parse_gpu_info(row["gpu_info"]),
+        "cpu_percent": row["cpu_percent"],
+        "memory_percent": row["memory_percent"],
+        "memory_used_bytes": row["memory_used_bytes"],
+        "memory_total_bytes": row["memory_total_bytes"],
+        "current_avg_temp": row["current_avg_temp"],
+        "current_max_temp": row["current_max_temp"],
     }
@@ -0,0 +1,48 @@
+"""
+Runner HTTP client service.
+
+Provides a shared, keep-alive httpx client for host -> runner requests
+(task dispatch, kill/pause/resume, VPS and filesystem proxying).
+"""
+
+import httpx
+
+from kohakuriver.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Shared client, created on first use and closed on host shutdown
+_runner_client: httpx.AsyncClient | None = None
+
+
+def get_runner_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client for talking to runners.
+
+    Connections are pooled per runner, so repeated requests to the same
+    runner do not reconnect every time. Callers pass absolute runner URLs
+    and their own per-request timeouts.
+
+    Returns:
+        Shared AsyncClient instance.
+    """
+    global _runner_client
+    if _runner_client is None or _runner_client.is_closed:
+        _runner_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(5.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=128,
+                keepalive_expiry=60.0,
+            ),
+        )
+        logger.debug("Created shared runner client")
+    return _runner_client
+
+
+async def close_runner_client() -> None:
+    """Close the shared runner client, if it was created."""
+    global _runner_client
+    if _runner_client is not None:
+        await _runner_client.aclose()
+        _runner_client = None
@@ -5,16 +5,27 @@ Handles task submission, assignment, and control operations.
 Provides communication with runner nodes for task lifecycle management.
 """
 
+import asyncio
 import datetime
 import json
 
 import httpx
 
 from kohakuriver.db.task import Task
+from kohakuriver.host.services.node_manager import track_task_cores
+from kohakuriver.host.services.runner_client import get_runner_client
 from kohakuriver.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Upper bound on concurrent kill RPCs to runners (e.g. during a mass cancel)
+MAX_CONCURRENT_KILLS = 32
+
+_kill_semaphore = asyncio.Semaphore(MAX_CONCURRENT_KILLS)
+
+# (runner_url, task_id) pairs with a kill already queued or in flight
+_inflight_kills: set[tuple[str, int]] = set()
+
 
 # =============================================================================
 # Task Execution
@@ -58,16 +69,16 @@ async def send_task_to_runner(
     logger.debug(f"Task payload: {payload}")
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{runner_url}/execute",
-                json=payload,
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            result = response.json()
-            logger.debug(f"Runner response: {result}")
-            return result
+        client = get_runner_client()
+        response = await client.post(
+            f"{runner_url}/execute",
+            json=payload,
+            timeout=30.0,
+        )
+        response.raise_for_status()
+        result = response.json()
+        logger.debug(f"Runner response: {result}")
+        return result
 
     except httpx.RequestError as e:
         logger.error(f"Failed to send task {task.task_id} to {runner_url}: {e}")
@@ -118,23 +129,23 @@ async def send_vps_task_to_runner(
     logger.debug(f"VPS payload: task_id={task.task_id}, ssh_port={task.ssh_port}")
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{runner_url}/vps/create",
-                json=payload,
-                timeout=60.0,  # VPS creation may take longer
-            )
-            response.raise_for_status()
-            result = response.json()
-
-            # Update SSH port from runner response if provided
-            ssh_port = result.get("ssh_port")
-            if ssh_port:
-                task.ssh_port = ssh_port
-                task.save()
-                logger.debug(f"Updated task SSH port to {ssh_port}")
-
-            return result
+        client = get_runner_client()
+        response = await client.post(
+            f"{runner_url}/vps/create",
+            json=payload,
+            timeout=60.0,  # VPS creation may take longer
+        )
+        response.raise_for_status()
+        result = response.json()
+
+        # Update SSH port from runner response if provided
+        ssh_port = result.get("ssh_port")
+        if ssh_port:
+            task.ssh_port = ssh_port
+            task.save()
+            logger.debug(f"Updated task SSH port to {ssh_port}")
+
+        return result
 
     except httpx.RequestError as e:
         logger.error(f"Failed to send VPS {task.task_id} to {runner_url}: {e}")
@@ -166,14 +177,14 @@ async def send_kill_to_runner(
     logger.info(f"Sending kill for task {task_id} to {runner_url}")
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{runner_url}/kill",
-                json={"task_id": task_id, "container_name": container_name},
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            logger.info(f"Kill for task {task_id} acknowledged by {runner_url}")
+        client = get_runner_client()
+        response = await client.post(
+            f"{runner_url}/kill",
+            json={"task_id": task_id, "container_name": container_name},
+            timeout=10.0,
+        )
+        response.raise_for_status()
+        logger.info(f"Kill for task {task_id} acknowledged by {runner_url}")
 
     except httpx.RequestError as e:
         logger.error(f"Failed to send kill for task {task_id} to {runner_url}: {e}")
@@ -186,6 +197,34 @@ async def send_kill_to_runner(
         )
 
 
+async def send_kill_to_runner_gated(
+    runner_url: str, task_id: int, container_name: str
+) -> None:
+    """
+    Send kill request to a runner with bounded concurrency.
+
+    Duplicate requests for a kill that is already queued or in flight are
+    dropped. Used for fire-and-forget kills so bursts cannot open an
+    unbounded number of connections to runners.
+
+    Args:
+        runner_url: Runner's HTTP URL.
+        task_id: Task ID to kill.
+        container_name: Container name for the task.
+    """
+    key = (runner_url, task_id)
+    if key in _inflight_kills:
+        logger.debug(f"Kill for task {task_id} already in flight, skipping")
+        return
+
+    _inflight_kills.add(key)
+    try:
+        async with _kill_semaphore:
+            await send_kill_to_runner(runner_url, task_id, container_name)
+    finally:
+        _inflight_kills.discard(key)
+
+
 async def send_pause_to_runner(
     runner_url: str,
     task_id: int,
@@ -205,15 +244,15 @@ async def send_pause_to_runner(
     logger.info(f"Sending pause for task {task_id} to {runner_url}")
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{runner_url}/pause",
-                json={"task_id": task_id, "container_name": container_name},
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            logger.info(f"Pause for task {task_id} acknowledged by {runner_url}")
-            return "Pause command sent successfully."
+        client = get_runner_client()
+        response = await client.post(
+            f"{runner_url}/pause",
+            json={"task_id": task_id, "container_name": container_name},
+            timeout=10.0,
+        )
+        response.raise_for_status()
+        logger.info(f"Pause for task {task_id} acknowledged by {runner_url}")
+        return "Pause command sent successfully."
 
     except httpx.RequestError as e:
         logger.error(f"Failed to send pause for task {task_id} to {runner_url}: {e}")
@@ -246,15 +285,15 @@ async def send_resume_to_runner(
     logger.info(f"Sending resume for task {task_id} to {runner_url}")
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{runner_url}/resume",
-                json={"task_id": task_id, "container_name": container_name},
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            logger.info(f"Resume for task {task_id} acknowledged by {runner_url}")
-            return "Resume command sent successfully."
+        client = get_runner_client()
+        response = await client.post(
+            f"{runner_url}/resume",
+            json={"task_id": task_id, "container_name": container_name},
+            timeout=10.0,
+        )
+        response.raise_for_status()
+        logger.info(f"Resume for task {task_id} acknowledged by {runner_url}")
+        return "Resume command sent successfully."
 
     except httpx.RequestError as e:
         logger.error(f"Failed to send resume for task {task_id} to {runner_url}: {e}")
@@ -279,6 +318,7 @@ def mark_task_killed(task: Task, message: str = "Kill requested by user.") -> No
     task.error_message = message
     task.completed_at = datetime.datetime.now()
     task.save()
+    track_task_cores(task)
     logger.info(f"Marked task {task.task_id} as 'killed'")
 
 
@@ -336,6 +376,7 @@ def update_task_status(
     )
 
     task.save()
+    track_task_cores(task)
     logger.info(f"Task {task_id} status updated to {status}")
     return True
 
@@ -296,9 +296,9 @@ class HeartbeatRequest(BaseModel):
     Contains runner health metrics and task status updates.
     """
 
-    running_tasks: list[int] = Field(
-        default_factory=list,
-        description="Currently running task IDs",
+    running_tasks: list[int] | None = Field(
+        default=None,
+        description="Currently running task IDs (None if unchanged since last sent)",
     )
     killed_tasks: list[HeartbeatKilledTaskInfo] = Field(
         default_factory=list,
@@ -336,6 +336,12 @@ class TaskStatusUpdate(BaseModel):
     ssh_port: int | None = None
 
 
+class TaskStatusUpdateBatch(BaseModel):
+    """Batch of task status updates from runner to host, in report order."""
+
+    updates: list[TaskStatusUpdate]
+
+
 # =============================================================================
 # Node Response Models
 # =============================================================================
@@ -6,10 +6,11 @@ Main entry point for the runner server.
 
 import asyncio
 import os
+import random
 import socket
+import sys
 
 import httpx
-import psutil
 from fastapi import FastAPI, Path, WebSocket
 
 from kohakuriver.docker.client import DockerManager
@@ -18,15 +19,35 @@ from kohakuriver.runner.background.startup_check import startup_check
 from kohakuriver.runner.config import config
 from kohakuriver.runner.endpoints import docker, filesystem, tasks, terminal, vps
 from kohakuriver.runner.numa.detector import detect_numa_topology
-from kohakuriver.runner.services.resource_monitor import get_gpu_stats, get_total_cores
+from kohakuriver.runner.services.host_client import (
+    close_host_client,
+    get_host_client,
+    get_host_connect_address,
+    resolve_host_address,
+)
+from kohakuriver.runner.services.resource_monitor import (
+    get_gpu_stats,
+    get_total_cores,
+    get_total_memory,
+)
+from kohakuriver.runner.services.task_executor import (
+    flush_status_reports,
+    run_status_flusher,
+)
 from kohakuriver.storage.vault import TaskStateStore
-from kohakuriver.utils.logger import configure_logging, get_logger
+from kohakuriver.utils.logger import configure_logging, flush_logging, get_logger
 
 logger = get_logger(__name__)
 
 # Background tasks set
 background_tasks: set[asyncio.Task] = set()
 
+# Registration retry policy: exponential backoff with jitter, so runners
+# restarting together do not hit the host in lockstep
+REGISTER_ATTEMPTS = 8
+REGISTER_BACKOFF_BASE_SECONDS = 0.5
+REGISTER_BACKOFF_MAX_SECONDS = 30.0
+
 # Global state
 numa_topology: dict | None = None
 task_store: TaskStateStore | None = None
@@ -64,7 +85,7 @@ def get_runner_url() -> str:
         # Try to get actual IP
         try:
             s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect((config.HOST_ADDRESS, config.HOST_PORT))
+            s.connect((get_host_connect_address(), config.HOST_PORT))
             ip = s.getsockname()[0]
             s.close()
         except Exception:
@@ -83,7 +104,7 @@ async def register_with_host() -> bool:
     hostname = get_hostname()
     runner_url = get_runner_url()
     total_cores = get_total_cores()
-    total_ram = psutil.virtual_memory().total
+    total_ram = get_total_memory()
     gpu_info = get_gpu_stats()
 
     register_data = {
@@ -95,22 +116,21 @@ async def register_with_host() -> bool:
         "gpu_info": gpu_info,
     }
 
-    host_url = f"http://{config.HOST_ADDRESS}:{config.HOST_PORT}"
+    client = get_host_client()
 
     logger.info(
-        f"Registering with host {host_url} as {hostname} "
+        f"Registering with host {client.base_url} as {hostname} "
         f"({total_cores} cores, NUMA: {'Yes' if numa_topology else 'No'}) "
         f"at {runner_url}"
     )
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{host_url}/register",
-                json=register_data,
-                timeout=15.0,
-            )
-            response.raise_for_status()
+        response = await client.post(
+            "/register",
+            json=register_data,
+            timeout=15.0,
+        )
+        response.raise_for_status()
         logger.info("Successfully registered with host.")
         return True
 
@@ -128,10 +148,43 @@ async def register_with_host() -> bool:
         return False
 
 
+def _install_pidfd_child_watcher() -> None:
+    """
+    Reap task subprocesses via pidfds on Python < 3.12.
+
+    Before 3.12 the default child watcher parks one thread in waitpid()
+    per running subprocess. PidfdChildWatcher instead registers each
+    child's pidfd with the event loop. Python 3.12+ already does this
+    by default, and kernels without pidfd_open (< 5.3) keep the default.
+    Only applies to the stdlib selector loop: uvloop reaps children itself
+    and its policy does not support child watchers.
+    """
+    if sys.version_info >= (3, 12) or not hasattr(os, "pidfd_open"):
+        return
+    loop = asyncio.get_running_loop()
+    if not isinstance(loop, asyncio.SelectorEventLoop):
+        return
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+    except OSError:
+        return
+
+    try:
+        watcher = asyncio.PidfdChildWatcher()
+        watcher.attach_loop(loop)
+        asyncio.set_child_watcher(watcher)
+    except Exception as e:
+        logger.debug(f"Keeping default child watcher: {e}")
+        return
+    logger.debug("Using pidfd child watcher for task subprocesses")
+
+
 async def startup_event():
     """Initialize runner and start background tasks."""
     global numa_topology, task_store
 
+    _install_pidfd_child_watcher()
+
     hostname = get_hostname()
     logger.info(
         f"Runner starting on {hostname} "
@@ -172,6 +225,11 @@ async def startup_event():
     db_path = config.get_state_db_path()
     task_store = TaskStateStore(db_path)
 
+    # Start sending task status updates to the host
+    flusher_task = asyncio.create_task(run_status_flusher())
+    background_tasks.add(flusher_task)
+    flusher_task.add_done_callback(background_tasks.discard)
+
     # Set dependencies on endpoint modules
     tasks.set_dependencies(task_store, numa_topology)
     vps.set_dependencies(task_store)
@@ -185,14 +243,18 @@ async def startup_event():
 
     # Register with host
     registered = False
-    for attempt in range(5):
+    for attempt in range(REGISTER_ATTEMPTS):
+        await resolve_host_address()
         registered = await register_with_host()
-        if registered:
+        if registered or attempt == REGISTER_ATTEMPTS - 1:
             break
-        wait_time = 5 * (attempt + 1)
+        wait_time = min(
+            REGISTER_BACKOFF_MAX_SECONDS,
+            REGISTER_BACKOFF_BASE_SECONDS * 2**attempt + random.uniform(0, 1),
+        )
         logger.info(
-            f"Registration attempt {attempt + 1}/5 failed. "
-            f"Retrying in {wait_time} seconds..."
+            f"Registration attempt {attempt + 1}/{REGISTER_ATTEMPTS} failed. "
+            f"Retrying in {wait_time:.1f} seconds..."
         )
         await asyncio.sleep(wait_time)
 
@@ -224,9 +286,11 @@ async def shutdown_event():
     """Clean shutdown."""
     logger.info("Runner shutting down.")
 
-    # Cancel background tasks
+    # Cancel background tasks and let them unwind before the final flush,
+    # so the status flusher is not sending at the same time
     for task in background_tasks:
         task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
 
     # Don't stop containers on shutdown - VPS containers have --restart unless-stopped
     # and should persist. Task containers will be cleaned up on next startup.
@@ -238,6 +302,10 @@ async def shutdown_event():
                 "They will be recovered or cleaned up on next startup."
             )
 
+    await flush_status_reports()
+    await close_host_client()
+    await flush_logging()
+
 
 app.add_event_handler("startup", startup_event)
 app.add_event_handler("shutdown", shutdown_event)
@@ -252,7 +320,7 @@ def run():
     log_level = config.LOG_LEVEL
 
     # Configure HakuRiver logging (IMPORTANT: must be called before uvicorn.run)
-    configure_logging(log_level)
+    configure_logging(log_level, enqueue=True)
 
     match log_level:
         case LogLevel.FULL:
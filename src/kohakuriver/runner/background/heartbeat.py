@@ -6,12 +6,18 @@ Matches old core/runner.py behavior for compatibility.
 """
 
 import asyncio
+import time
 from typing import Callable
 
 import httpx
 
 from kohakuriver.models.requests import HeartbeatKilledTaskInfo, HeartbeatRequest
 from kohakuriver.runner.config import config
+from kohakuriver.runner.services.host_client import (
+    JSON_HEADERS,
+    get_host_client,
+    resolve_host_address,
+)
 from kohakuriver.runner.services.resource_monitor import get_gpu_stats, get_system_stats
 from kohakuriver.storage.vault import TaskStateStore
 from kohakuriver.utils.logger import get_logger
@@ -21,17 +27,68 @@ logger = get_logger(__name__)
 # List of killed tasks pending report to host
 killed_tasks_pending_report: list[HeartbeatKilledTaskInfo] = []
 
+# Upper bound on pending killed reports while the host is unreachable
+MAX_PENDING_KILLED_REPORTS = 10000
+
+# Resend the running task list at least this often, even if unchanged,
+# so a restarted host relearns it
+FULL_RUNNING_TASKS_EVERY = 12
+
+# Adaptive interval: back off while the host is slow or unreachable. The
+# cap keeps beats well inside the host's dead-runner timeout
+# (HEARTBEAT_TIMEOUT_FACTOR intervals, 6 by default).
+HEARTBEAT_TARGET_RTT_SECONDS = 0.5
+HEARTBEAT_MAX_INTERVAL_FACTOR = 2.0
+HEARTBEAT_RTT_SMOOTHING = 0.2
+
+# Minimum time between re-registration attempts triggered by a 404
+REGISTER_COOLDOWN_SECONDS = 5.0
+
+
+def _next_interval(rtt_avg: float) -> float:
+    """Get the heartbeat interval for a smoothed host round-trip time."""
+    base = config.HEARTBEAT_INTERVAL_SECONDS
+    scale = max(1.0, rtt_avg / HEARTBEAT_TARGET_RTT_SECONDS)
+    return min(base * scale, base * HEARTBEAT_MAX_INTERVAL_FACTOR)
+
+
+def _backoff_interval(interval: float) -> float:
+    """Double the heartbeat interval after a failure, up to the cap."""
+    return min(
+        interval * 2, config.HEARTBEAT_INTERVAL_SECONDS * HEARTBEAT_MAX_INTERVAL_FACTOR
+    )
+
+
+def _trim_pending_reports() -> None:
+    """Drop the oldest pending killed reports beyond the size cap."""
+    overflow = len(killed_tasks_pending_report) - MAX_PENDING_KILLED_REPORTS
+    if overflow > 0:
+        del killed_tasks_pending_report[:overflow]
+        logger.warning(f"Dropped {overflow} oldest killed task reports (queue full)")
+
 
 def report_killed_task(task_id: int, reason: str):
     """Add a killed task to the pending report list."""
     killed_tasks_pending_report.append(
-        HeartbeatKilledTaskInfo(task_id=task_id, reason=reason)
+        HeartbeatKilledTaskInfo.model_construct(task_id=task_id, reason=reason)
     )
+    _trim_pending_reports()
     logger.debug(
         f"Task {task_id} added to killed tasks pending report (reason: {reason})"
     )
 
 
+def _requeue_killed_reports(killed_payload: list[HeartbeatKilledTaskInfo]) -> None:
+    """Put unsent killed reports back at the front for the next heartbeat."""
+    if not killed_payload:
+        return
+    killed_tasks_pending_report[:0] = killed_payload
+    _trim_pending_reports()
+    logger.warning(
+        f"Re-added {len(killed_payload)} killed task reports for next heartbeat."
+    )
+
+
 async def send_heartbeat(
     hostname: str,
     numa_topology: dict | None,
@@ -50,25 +107,46 @@ async def send_heartbeat(
         register_callback: Callback to re-register if needed.
     """
     global killed_tasks_pending_report
-    host_url = f"http://{config.HOST_ADDRESS}:{config.HOST_PORT}"
 
-    while True:
-        await asyncio.sleep(config.HEARTBEAT_INTERVAL_SECONDS)
+    # Running task set the host last acknowledged (None forces a full send)
+    last_sent_running: frozenset[int] | None = None
+    heartbeats_since_full = 0
+    # Cleared if the host rejects heartbeats without the list (older host)
+    omit_unchanged_running = True
 
-        # Get current running task IDs
-        running_task_ids = list(task_store.get_all_task_ids())
+    interval = float(config.HEARTBEAT_INTERVAL_SECONDS)
+    rtt_avg = 0.0
 
-        # Copy and clear killed tasks list
-        killed_payload = killed_tasks_pending_report.copy()
-        killed_tasks_pending_report.clear()
+    # Re-registration runs beside the loop so heartbeats keep ticking
+    register_task: asyncio.Task | None = None
+    last_register_attempt = float("-inf")
+
+    while True:
+        await asyncio.sleep(interval)
+
+        # Get current running task IDs; only send them when they changed
+        running_task_ids = task_store.get_all_task_ids()
+        running_set = frozenset(running_task_ids)
+        heartbeats_since_full += 1
+        send_running = (
+            not omit_unchanged_running
+            or running_set != last_sent_running
+            or heartbeats_since_full >= FULL_RUNNING_TASKS_EVERY
+        )
+
+        # Take the pending list by swapping in a fresh one (no copy needed;
+        # nothing can append in between since there is no await)
+        killed_payload = killed_tasks_pending_report
+        killed_tasks_pending_report = []
 
         # Gather resource stats
         stats = get_system_stats()
         gpu_info = get_gpu_stats()
 
-        # Build heartbeat payload (matches old HeartbeatData)
-        payload = HeartbeatRequest(
-            running_tasks=running_task_ids,
+        # Build heartbeat payload (matches old HeartbeatData). All fields are
+        # produced locally, so skip validation and go straight to serialization.
+        payload = HeartbeatRequest.model_construct(
+            running_tasks=running_task_ids if send_running else None,
             killed_tasks=killed_payload,
             cpu_percent=stats["cpu_percent"],
             memory_percent=stats["memory_percent"],
@@ -80,24 +158,32 @@ async def send_heartbeat(
         )
 
         try:
-            async with httpx.AsyncClient() as client:
-                # Use PUT /heartbeat/{hostname} to match old API
-                response = await client.put(
-                    f"{host_url}/heartbeat/{hostname}",
-                    json=payload.model_dump(mode="json"),
-                    timeout=10.0,
-                )
-                response.raise_for_status()
-                # Success: killed_payload was sent
+            # Re-resolves the host only when the cached address has expired
+            await resolve_host_address()
+
+            # Use PUT /heartbeat/{hostname} to match old API
+            sent_at = time.monotonic()
+            response = await get_host_client().put(
+                f"/heartbeat/{hostname}",
+                content=payload.model_dump_json(),
+                headers=JSON_HEADERS,
+                timeout=10.0,
+            )
+            response.raise_for_status()
+            # Success: killed_payload was sent
+            rtt = time.monotonic() - sent_at
+            rtt_avg += HEARTBEAT_RTT_SMOOTHING * (rtt - rtt_avg)
+            interval = _next_interval(rtt_avg)
+            if send_running:
+                last_sent_running = running_set
+                heartbeats_since_full = 0
 
         except httpx.RequestError as e:
             logger.warning(f"Failed to send heartbeat to host: {e}")
             # Failure: Put the killed tasks back to be reported next time
-            if killed_payload:
-                killed_tasks_pending_report.extend(killed_payload)
-                logger.warning(
-                    f"Re-added {len(killed_payload)} killed task reports for next heartbeat."
-                )
+            _requeue_killed_reports(killed_payload)
+            last_sent_running = None
+            interval = _backoff_interval(interval)
 
         except httpx.HTTPStatusError as e:
             logger.warning(
@@ -105,20 +191,26 @@ async def send_heartbeat(
                 f"{e.response.text}"
             )
             if e.response.status_code == 404:
-                logger.warning("Node seems unregistered, attempting to re-register...")
-                await register_callback()
+                now = time.monotonic()
+                if (
+                    register_task is None or register_task.done()
+                ) and now - last_register_attempt >= REGISTER_COOLDOWN_SECONDS:
+                    logger.warning(
+                        "Node seems unregistered, attempting to re-register..."
+                    )
+                    last_register_attempt = now
+                    register_task = asyncio.create_task(register_callback())
+            elif e.response.status_code == 422 and not send_running:
+                logger.info("Host requires running tasks in every heartbeat")
+                omit_unchanged_running = False
             # Failure: Put the killed tasks back
-            if killed_payload:
-                killed_tasks_pending_report.extend(killed_payload)
-                logger.warning(
-                    f"Re-added {len(killed_payload)} killed task reports for next heartbeat."
-                )
+            _requeue_killed_reports(killed_payload)
+            last_sent_running = None
+            interval = _backoff_interval(interval)
 
         except Exception as e:
             logger.exception(f"Unexpected error sending heartbeat: {e}")
             # Failure: Put the killed tasks back
-            if killed_payload:
-                killed_tasks_pending_report.extend(killed_payload)
-                logger.warning(
-                    f"Re-added {len(killed_payload)} killed task reports for next heartbeat."
-                )
+            _requeue_killed_reports(killed_payload)
+            last_sent_running = None
+            interval = _backoff_interval(interval)
@@ -9,7 +9,8 @@ All Docker operations are wrapped in asyncio.to_thread to prevent blocking.
 
 import asyncio
 import datetime
-import subprocess
+
+from docker.models.containers import Container
 
 from kohakuriver.docker.client import DockerManager
 from kohakuriver.docker.naming import (
@@ -25,43 +26,40 @@ from kohakuriver.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
-def _find_ssh_port(container_name: str) -> int:
+def _find_ssh_port(container: Container) -> int:
     """
     Find the mapped SSH port for a container.
 
+    Reads the port bindings from the container's inspect data, which the
+    container listing already fetched, instead of running `docker port`.
+
     Returns:
         SSH port number, or 0 if not found (VPS will still work via TTY).
     """
     try:
-        result = subprocess.run(
-            ["docker", "port", container_name, "22"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        # Parse: "0.0.0.0:32792\n[::]:32792\n"
-        port_mapping = result.stdout.splitlines()[0].strip()
-        return int(port_mapping.split(":")[1])
-    except subprocess.CalledProcessError:
+        bindings = container.attrs["NetworkSettings"]["Ports"].get("22/tcp")
+        if bindings:
+            return int(bindings[0]["HostPort"])
+    except (KeyError, IndexError, TypeError, ValueError, AttributeError) as e:
         logger.warning(
-            f"SSH port not available for container '{container_name}'. VPS will work via TTY only."
-        )
-        return 0
-    except (IndexError, ValueError) as e:
-        logger.warning(
-            f"Failed to parse SSH port for '{container_name}': {e}. VPS will work via TTY only."
+            f"Failed to parse SSH port for '{container.name}': {e}. VPS will work via TTY only."
         )
         return 0
 
+    logger.warning(
+        f"SSH port not available for container '{container.name}'. VPS will work via TTY only."
+    )
+    return 0
+
 
-def _get_running_containers() -> tuple[list, set[str]]:
+def _get_running_containers() -> tuple[list, dict[str, Container]]:
     """Get running containers (blocking, run in executor)."""
     docker_manager = DockerManager()
     all_running = docker_manager.list_containers(all=False)
-    running_container_names = {
-        c.name for c in all_running if is_kohakuriver_container(c.name)
+    running_containers = {
+        c.name: c for c in all_running if is_kohakuriver_container(c.name)
     }
-    return all_running, running_container_names
+    return all_running, running_containers
 
 
 def _stop_and_remove_container(container_name: str, timeout: int = 10):
@@ -83,18 +81,16 @@ async def startup_check(task_store: TaskStateStore):
     5. Updates store for containers that are still running
     """
     # Get all running containers in executor
-    all_running, running_container_names = await asyncio.to_thread(
-        _get_running_containers
-    )
+    all_running, running_containers = await asyncio.to_thread(_get_running_containers)
 
     # Check tracked tasks
-    tracked_tasks = list(task_store.items())  # Copy to avoid mutation during iteration
+    tracked_tasks = task_store.items()  # Already a snapshot list
 
     for task_id_str, task_data in tracked_tasks:
         task_id = int(task_id_str)
         container_name = task_data.get("container_name")
 
-        if container_name not in running_container_names:
+        if container_name not in running_containers:
             # Container is not running - report as "stopped"
             logger.warning(
                 f"Container {container_name} for task {task_id} not found. "
@@ -117,7 +113,7 @@ async def startup_check(task_store: TaskStateStore):
             # Container is still running
             # For VPS containers, recover the SSH port and report to host
             if container_name.startswith(VPS_PREFIX):
-                ssh_port = _find_ssh_port(container_name)
+                ssh_port = _find_ssh_port(running_containers[container_name])
                 if ssh_port > 0:
                     logger.info(
                         f"VPS container {container_name} for task {task_id} recovered, "
@@ -176,7 +172,7 @@ async def startup_check(task_store: TaskStateStore):
             # Orphan container - check if it's a VPS
             if container.name.startswith(VPS_PREFIX):
                 # Try to recover VPS - it can work without SSH port via TTY
-                ssh_port = _find_ssh_port(container.name)
+                ssh_port = _find_ssh_port(container)
                 if ssh_port > 0:
                     logger.info(
                         f"Recovering orphan VPS container {container.name} "
@@ -99,7 +99,7 @@ async def kill_task_endpoint(request: TaskControlRequest):
             detail=f"Task {task_id} not found.",
         )
 
-    success = kill_task(task_id, container_name, task_store)
+    success = await kill_task(task_id, container_name, task_store)
     if not success:
         raise HTTPException(
             status_code=500,
@@ -125,7 +125,7 @@ async def pause_task_endpoint(request: TaskControlRequest):
             detail=f"Task {task_id} not found.",
         )
 
-    success = pause_task(task_id, container_name, task_store)
+    success = await pause_task(task_id, container_name, task_store)
     if not success:
         raise HTTPException(
             status_code=500,
@@ -151,7 +151,7 @@ async def resume_task_endpoint(request: TaskControlRequest):
             detail=f"Task {task_id} not found.",
         )
 
-    success = resume_task(task_id, container_name, task_store)
+    success = await resume_task(task_id, container_name, task_store)
     if not success:
         raise HTTPException(
             status_code=500,
@@ -0,0 +1,163 @@
+"""
+Host HTTP client service.
+
+Provides a shared, keep-alive httpx client for runner -> host requests
+(registration, heartbeats, task status updates).
+
+The host address is resolved once and cached for HOST_DNS_TTL_SECONDS,
+so new connections do not trigger a blocking DNS lookup.
+"""
+
+import asyncio
+import ipaddress
+import socket
+import time
+
+import httpx
+
+from kohakuriver.runner.config import config
+from kohakuriver.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# How long a resolved host address is trusted before re-resolving
+HOST_DNS_TTL_SECONDS = 3600
+
+# Shared client, created on first use and closed on runner shutdown
+_host_client: httpx.AsyncClient | None = None
+
+# Grace period before closing a client replaced after an address change,
+# longer than any request timeout so in-flight requests can finish
+HOST_CLIENT_RETIRE_DELAY_SECONDS = 30.0
+
+# Pending closes of replaced clients
+_retire_tasks: set[asyncio.Task] = set()
+
+# Cached resolution of config.HOST_ADDRESS: (ip, monotonic resolve time)
+_resolved_host: tuple[str, float] | None = None
+
+# Headers for request bodies pre-serialized with model_dump_json()
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+# =============================================================================
+# Address Resolution
+# =============================================================================
+
+
+def _is_ip_address(address: str) -> bool:
+    """Check whether an address is a literal IPv4/IPv6 address."""
+    try:
+        ipaddress.ip_address(address)
+        return True
+    except ValueError:
+        return False
+
+
+async def resolve_host_address() -> None:
+    """
+    Resolve config.HOST_ADDRESS and cache the result.
+
+    No-op for literal IP addresses or while the cached result is fresh.
+    Resolution failures are logged and the hostname keeps being used.
+    The current address is kept as long as DNS still returns it, so
+    round-robin records do not cause churn. If it does change, the next
+    request gets a new client and the old one is closed after a grace
+    period instead of under its in-flight requests.
+    """
+    global _resolved_host, _host_client
+
+    if _is_ip_address(config.HOST_ADDRESS):
+        return
+    if (
+        _resolved_host is not None
+        and time.monotonic() - _resolved_host[1] < HOST_DNS_TTL_SECONDS
+    ):
+        return
+
+    try:
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            config.HOST_ADDRESS, config.HOST_PORT, type=socket.SOCK_STREAM
+        )
+    except OSError as e:
+        logger.warning(f"Failed to resolve host {config.HOST_ADDRESS}: {e}")
+        return
+
+    resolved_ips = [info[4][0] for info in infos]
+    previous_ip = _resolved_host[0] if _resolved_host else None
+    ip = previous_ip if previous_ip in resolved_ips else resolved_ips[0]
+    _resolved_host = (ip, time.monotonic())
+
+    if ip != previous_ip:
+        logger.info(f"Resolved host {config.HOST_ADDRESS} to {ip}")
+        old_client, _host_client = _host_client, None
+        if old_client is not None:
+            task = asyncio.create_task(_retire_client(old_client))
+            _retire_tasks.add(task)
+            task.add_done_callback(_retire_tasks.discard)
+
+
+def get_host_connect_address() -> str:
+    """Get the address to connect to the host with (cached IP if resolved)."""
+    if _resolved_host is not None:
+        return _resolved_host[0]
+    return config.HOST_ADDRESS
+
+
+# =============================================================================
+# Shared Client
+# =============================================================================
+
+
+def get_host_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client for talking to the host.
+
+    Requests made through this client reuse pooled keep-alive connections,
+    so heartbeats and status reports do not reconnect every time.
+
+    Returns:
+        AsyncClient with base_url set to the host URL.
+    """
+    global _host_client
+    if _host_client is None or _host_client.is_closed:
+        address = get_host_connect_address()
+        headers = {}
+        if address != config.HOST_ADDRESS:
+            # Connect by IP but keep addressing the configured host name
+            headers["Host"] = f"{config.HOST_ADDRESS}:{config.HOST_PORT}"
+        if ":" in address:
+            address = f"[{address}]"  # IPv6 literal
+
+        _host_client = httpx.AsyncClient(
+            base_url=f"http://{address}:{config.HOST_PORT}",
+            headers=headers,
+            timeout=httpx.Timeout(10.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=4,
+                max_connections=8,
+                # Must stay below the host's keep-alive timeout (75s)
+                keepalive_expiry=60.0,
+            ),
+        )
+        logger.debug(f"Created host client for {_host_client.base_url}")
+    return _host_client
+
+
+async def _retire_client(client: httpx.AsyncClient) -> None:
+    """Close a replaced client once its in-flight requests have had time to finish."""
+    try:
+        await asyncio.sleep(HOST_CLIENT_RETIRE_DELAY_SECONDS)
+    finally:
+        await client.aclose()
+
+
+async def close_host_client() -> None:
+    """Close the shared host client and any replaced ones still open."""
+    global _host_client
+    if _host_client is not None:
+        await _host_client.aclose()
+        _host_client = None
+    for task in list(_retire_tasks):
+        task.cancel()
+    await asyncio.gather(*_retire_tasks, return_exceptions=True)
@@ -2,8 +2,15 @@
 Resource monitoring service.
 
 Monitors system resources (CPU, memory, temperature, GPU).
+
+On Linux, CPU and memory usage are read straight from /proc (one small
+read each) instead of through psutil, since they are sampled on every
+heartbeat. Other platforms fall back to psutil.
 """
 
+import functools
+import os
+
 import psutil
 
 from kohakuriver.utils.gpu import get_gpu_info
@@ -11,6 +18,109 @@ from kohakuriver.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_PROC_STAT = "/proc/stat"
+_PROC_MEMINFO = "/proc/meminfo"
+_USE_PROCFS = os.path.exists(_PROC_STAT) and os.path.exists(_PROC_MEMINFO)
+
+# (idle, total) jiffies from the previous /proc/stat sample
+_prev_cpu_times: tuple[int, int] | None = None
+
+# MemTotal never changes while the runner is up
+_mem_total_bytes: int | None = None
+
+
+# =============================================================================
+# /proc Readers
+# =============================================================================
+
+
+def _read_proc_cpu_percent() -> float:
+    """
+    Get CPU usage since the previous call from /proc/stat.
+
+    Matches psutil.cpu_percent(interval=None): the first call returns 0.0.
+    """
+    global _prev_cpu_times
+
+    with open(_PROC_STAT, "rb") as f:
+        fields = f.readline().split()
+
+    # user nice system idle iowait irq softirq steal (guest is already in user)
+    times = [int(v) for v in fields[1:9]]
+    idle = times[3] + times[4]
+    total = sum(times)
+
+    prev = _prev_cpu_times
+    _prev_cpu_times = (idle, total)
+    if prev is None or total <= prev[1]:
+        return 0.0
+
+    busy_fraction = 1.0 - (idle - prev[0]) / (total - prev[1])
+    return round(max(0.0, busy_fraction) * 100, 1)
+
+
+def _meminfo_field(data: bytes, key: bytes) -> int:
+    """Extract a 'Key:   123 kB' field from /proc/meminfo content, in bytes."""
+    start = data.index(key) + len(key)
+    end = data.index(b"kB", start)
+    return int(data[start:end]) * 1024
+
+
+def _read_proc_memory() -> tuple[int, int, int]:
+    """
+    Get (total, available, used) memory in bytes from /proc/meminfo.
+
+    Used memory follows psutil's definition: total minus free, buffers
+    and page cache (including reclaimable slab).
+    """
+    global _mem_total_bytes
+
+    with open(_PROC_MEMINFO, "rb") as f:
+        data = f.read()
+
+    if _mem_total_bytes is None:
+        _mem_total_bytes = _meminfo_field(data, b"MemTotal:")
+    total = _mem_total_bytes
+    free = _meminfo_field(data, b"MemFree:")
+    cached = _meminfo_field(data, b"Cached:")
+    if b"SReclaimable:" in data:
+        cached += _meminfo_field(data, b"SReclaimable:")
+    used = total - free - _meminfo_field(data, b"Buffers:") - cached
+    if used < 0:
+        # Happens in some containers (LXC); same fallback as psutil
+        used = total - free
+    return total, _meminfo_field(data, b"MemAvailable:"), used
+
+
+def _get_cpu_and_memory() -> tuple[float, float, int, int]:
+    """
+    Get (cpu_percent, memory_percent, memory_used_bytes, memory_total_bytes).
+
+    Values match psutil.virtual_memory(): the percentage is based on
+    available memory, used bytes on psutil's ``used``.
+    """
+    if _USE_PROCFS:
+        try:
+            cpu_percent = _read_proc_cpu_percent()
+            total, available, used = _read_proc_memory()
+            percent = round((total - available) / total * 100, 1)
+            return cpu_percent, percent, used, total
+        except (OSError, ValueError, IndexError) as e:
+            logger.debug(f"Falling back to psutil for system stats: {e}")
+
+    mem_info = psutil.virtual_memory()
+    return (
+        psutil.cpu_percent(interval=None),
+        mem_info.percent,
+        mem_info.used,
+        mem_info.total,
+    )
+
+
+# =============================================================================
+# Public API
+# =============================================================================
+
 
 def get_system_stats() -> dict:
     """
@@ -25,11 +135,8 @@ def get_system_stats() -> dict:
         - current_avg_temp: Average CPU temperature
         - current_max_temp: Maximum CPU temperature
     """
-    # CPU usage
-    cpu_percent = psutil.cpu_percent(interval=None)
-
-    # Memory usage
-    mem_info = psutil.virtual_memory()
+    # CPU and memory usage
+    cpu_percent, memory_percent, memory_used, memory_total = _get_cpu_and_memory()
 
     # Temperature
     avg_temp = None
@@ -49,9 +156,9 @@ def get_system_stats() -> dict:
 
     return {
         "cpu_percent": cpu_percent,
-        "memory_percent": mem_info.percent,
-        "memory_used_bytes": mem_info.used,
-        "memory_total_bytes": mem_info.total,
+        "memory_percent": memory_percent,
+        "memory_used_bytes": memory_used,
+        "memory_total_bytes": memory_total,
         "current_avg_temp": avg_temp,
         "current_max_temp": max_temp,
     }
@@ -74,9 +181,10 @@ def get_gpu_stats() -> list[dict]:
         return []
 
 
+@functools.lru_cache(maxsize=1)
 def get_total_cores() -> int:
     """
-    Get total CPU core count.
+    Get total CPU core count (computed once; invariant for the process).
 
     Returns:
         Number of CPU cores.
@@ -88,11 +196,17 @@ def get_total_cores() -> int:
     return cores
 
 
+@functools.lru_cache(maxsize=1)
 def get_total_memory() -> int:
     """
-    Get total system memory in bytes.
+    Get total system memory in bytes (computed once; invariant for the process).
 
     Returns:
         Total memory in bytes.
     """
+    if _USE_PROCFS:
+        try:
+            return _read_proc_memory()[0]
+        except (OSError, ValueError) as e:
+            logger.debug(f"Falling back to psutil for total memory: {e}")
     return psutil.virtual_memory().total
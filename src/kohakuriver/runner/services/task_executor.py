@@ -3,22 +3,26 @@ Task execution service.
 
 Handles Docker container creation and task lifecycle management.
 Uses subprocess-based Docker execution for task containers (matching old behavior).
+Control operations (kill/pause/resume) go through the shared Docker API client.
 """
 
 import asyncio
+import collections
 import datetime
 import functools
 import os
 import shlex
-import subprocess
+import time
 
 import httpx
 
 from kohakuriver.docker import utils as docker_utils
+from kohakuriver.docker.client import get_docker_manager
 from kohakuriver.docker.naming import image_tag, task_container_name
-from kohakuriver.models.requests import TaskStatusUpdate
+from kohakuriver.models.requests import TaskStatusUpdate, TaskStatusUpdateBatch
 from kohakuriver.runner.config import config
 from kohakuriver.runner.numa.detector import get_numa_prefix
+from kohakuriver.runner.services.host_client import JSON_HEADERS, get_host_client
 from kohakuriver.storage.vault import TaskStateStore
 from kohakuriver.utils.logger import format_traceback, get_logger
 
@@ -27,87 +31,299 @@ logger = get_logger(__name__)
 # Lock for Docker image sync operations to prevent concurrent syncs
 docker_sync_lock = asyncio.Lock()
 
+# Status updates waiting to be sent to the host, in report order
+_status_queue: asyncio.Queue[TaskStatusUpdate] = asyncio.Queue()
 
-def _run_docker_command(
-    cmd: list[str], check: bool = False, timeout: int | None = None
-) -> subprocess.CompletedProcess:
+# How long the flusher waits for more updates to join a batch
+STATUS_BATCH_WINDOW_SECONDS = 0.05
+
+# Delay before re-sending updates the host could not be reached for
+STATUS_RETRY_DELAY_SECONDS = 2.0
+
+# Updates taken off the queue but not yet delivered, in report order
+_unsent_updates: list[TaskStatusUpdate] = []
+
+# Server errors in a row after which a task's update is dropped, so one
+# update the host cannot apply does not hold back every later report
+STATUS_MAX_SERVER_ERRORS = 10
+
+# Consecutive server errors per task ID for its pending update
+_status_server_errors: dict[int, int] = {}
+
+# Cleared if the host has no batch endpoint (older host version)
+_batch_updates_supported = True
+
+# Log directories already created by this runner process, least recently
+# used first. Bounded since every task gets its own log directory.
+_ensured_dirs: collections.OrderedDict[str, None] = collections.OrderedDict()
+MAX_ENSURED_DIRS = 1024
+
+
+# =============================================================================
+# Status Reporting
+# =============================================================================
+
+
+async def report_status_to_host(update: TaskStatusUpdate):
     """
-    Run a Docker command via subprocess.
+    Queue a task status update for the host.
+
+    Updates are sent in order by run_status_flusher(), which coalesces
+    updates reported within a short window into one request.
 
     Args:
-        cmd: Command list to run.
-        check: If True, raise CalledProcessError on non-zero exit.
-        timeout: Optional timeout in seconds.
+        update: Task status update data.
+    """
+    logger.info(f"[Task {update.task_id}] Queueing status '{update.status}' for host")
+    _status_queue.put_nowait(update)
 
-    Returns:
-        CompletedProcess result.
+
+async def _report_task_failed(
+    task_id: int,
+    error_message: str,
+    started_at: datetime.datetime | None = None,
+) -> None:
     """
-    logger.debug(f"Running docker command: {' '.join(shlex.quote(c) for c in cmd)}")
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=check,
-            timeout=timeout,
+    Report a task as failed to the host.
+
+    Args:
+        task_id: Task ID that failed.
+        error_message: Failure reason reported to the host.
+        started_at: When the task started, if it got that far.
+    """
+    await report_status_to_host(
+        TaskStatusUpdate(
+            task_id=task_id,
+            status="failed",
+            message=error_message,
+            started_at=started_at,
+            completed_at=datetime.datetime.now(),
         )
-        if result.returncode != 0:
-            logger.debug(f"  Command returned non-zero: {result.returncode}")
-            if result.stderr:
-                logger.debug(f"  stderr: {result.stderr.strip()}")
-        else:
-            logger.debug(f"  Command succeeded")
-        return result
-    except subprocess.TimeoutExpired as e:
-        logger.error(f"Docker command timed out: {e}")
-        raise
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Docker command failed: {e}")
-        logger.debug(f"  stderr: {e.stderr}")
-        raise
-    except Exception as e:
-        logger.exception(f"Unexpected error running docker command: {e}")
-        raise
+    )
 
 
-async def report_status_to_host(update: TaskStatusUpdate):
+async def run_status_flusher() -> None:
+    """
+    Send queued status updates to the host in batches.
+
+    Runs for the lifetime of the runner as a background task. Updates that
+    could not be delivered are kept, in order, and retried together with
+    anything queued in the meantime.
+    """
+    global _unsent_updates
+
+    while True:
+        if not _unsent_updates:
+            _unsent_updates.append(await _status_queue.get())
+
+        # Give concurrent completions a moment to join this batch
+        await asyncio.sleep(STATUS_BATCH_WINDOW_SECONDS)
+        while not _status_queue.empty():
+            _unsent_updates.append(_status_queue.get_nowait())
+
+        # Take the batch out before sending, so a shutdown that cancels this
+        # send does not deliver it a second time from flush_status_reports()
+        batch, _unsent_updates = _unsent_updates, []
+        try:
+            _unsent_updates = await _send_status_batch(batch)
+        except Exception as e:
+            # Keep the flusher alive; the updates stay queued for retry
+            logger.exception(f"Unexpected error sending status updates: {e}")
+            _unsent_updates = batch
+
+        if _unsent_updates:
+            logger.warning(
+                f"Retrying {len(_unsent_updates)} status updates in "
+                f"{STATUS_RETRY_DELAY_SECONDS}s"
+            )
+            await asyncio.sleep(STATUS_RETRY_DELAY_SECONDS)
+
+
+async def flush_status_reports() -> None:
+    """Send any status updates still queued (used on shutdown)."""
+    batch = list(_unsent_updates)
+    _unsent_updates.clear()
+    while not _status_queue.empty():
+        batch.append(_status_queue.get_nowait())
+    if batch:
+        await _send_status_batch(batch)
+
+
+def _coalesce_status_updates(
+    batch: list[TaskStatusUpdate],
+) -> list[TaskStatusUpdate]:
     """
-    Report task status update to the host.
+    Collapse multiple updates for the same task into its latest one.
+
+    A short task's "running" and terminal updates often land in the same
+    batch; only the final state needs to reach the host. started_at and
+    ssh_port from superseded updates are carried over if the latest
+    update does not set them.
 
     Args:
-        update: Task status update data.
+        batch: Status updates in report order.
+
+    Returns:
+        One update per task, in order of each task's first update.
     """
-    host_url = f"http://{config.HOST_ADDRESS}:{config.HOST_PORT}"
-    logger.debug(
-        f"[Task {update.task_id}] report_status_to_host called: status={update.status}"
-    )
-    logger.info(
-        f"[Task {update.task_id}] Reporting status '{update.status}' to host {host_url}"
-    )
+    latest: dict[int, TaskStatusUpdate] = {}
+    for update in batch:
+        previous = latest.get(update.task_id)
+        if previous is not None:
+            carried = {
+                field: getattr(previous, field)
+                for field in ("started_at", "ssh_port")
+                if getattr(update, field) is None
+                and getattr(previous, field) is not None
+            }
+            if carried:
+                update = update.model_copy(update=carried)
+        latest[update.task_id] = update
+    return list(latest.values())
+
+
+async def _send_status_batch(
+    batch: list[TaskStatusUpdate],
+) -> list[TaskStatusUpdate]:
+    """
+    Send a batch of status updates, falling back to one request each.
 
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{host_url}/update",
-                json=update.model_dump(mode="json"),
+    Args:
+        batch: Status updates in report order.
+
+    Returns:
+        Updates that could not be delivered because the host was unreachable
+        or failed with a server error. Updates the host rejected as invalid,
+        or failed on STATUS_MAX_SERVER_ERRORS times, are logged and dropped.
+    """
+    global _batch_updates_supported
+
+    batch = _coalesce_status_updates(batch)
+
+    if len(batch) > 1 and _batch_updates_supported:
+        task_ids = [update.task_id for update in batch]
+        try:
+            response = await get_host_client().post(
+                "/updates",
+                content=TaskStatusUpdateBatch.model_construct(
+                    updates=batch
+                ).model_dump_json(),
+                headers=JSON_HEADERS,
                 timeout=15.0,
             )
             response.raise_for_status()
+            logger.info(f"Host acknowledged {len(batch)} status updates: {task_ids}")
+            for task_id in task_ids:
+                _status_server_errors.pop(task_id, None)
+            return []
+
+        except httpx.HTTPStatusError as e:
+            status_code = e.response.status_code
+            if status_code in (404, 405):
+                logger.info("Host has no batch status endpoint, sending individually")
+                _batch_updates_supported = False
+            else:
+                # One bad update must not cost the others their delivery
+                logger.warning(
+                    f"Host failed status batch for {task_ids} ({status_code}), "
+                    "sending individually"
+                )
+
+        except httpx.RequestError as e:
+            logger.error(f"Failed to report status for {task_ids} to host: {e}")
+            return batch
+
+    for index, update in enumerate(batch):
+        if not await _send_status_update(update):
+            return batch[index:]
+    return []
+
+
+async def _send_status_update(update: TaskStatusUpdate) -> bool:
+    """
+    Send a single status update to the host.
+
+    Returns:
+        False if the update should be retried (host unreachable, or a
+        server error fewer than STATUS_MAX_SERVER_ERRORS times in a row),
+        True otherwise (including when the update was dropped).
+    """
+    client = get_host_client()
+    logger.debug(
+        f"[Task {update.task_id}] Reporting status '{update.status}' "
+        f"to host {client.base_url}"
+    )
+
+    try:
+        response = await client.post(
+            "/update",
+            content=update.model_dump_json(),
+            headers=JSON_HEADERS,
+            timeout=15.0,
+        )
+        response.raise_for_status()
         logger.info(
             f"[Task {update.task_id}] Host acknowledged status update: {update.status}"
         )
 
     except httpx.RequestError as e:
         logger.error(f"[Task {update.task_id}] Failed to report status to host: {e}")
+        return False
     except httpx.HTTPStatusError as e:
         logger.error(
             f"[Task {update.task_id}] Host rejected status update: "
             f"{e.response.status_code} - {e.response.text}"
         )
+        if e.response.status_code >= 500:
+            errors = _status_server_errors.get(update.task_id, 0) + 1
+            if errors < STATUS_MAX_SERVER_ERRORS:
+                _status_server_errors[update.task_id] = errors
+                return False
+            logger.error(
+                f"[Task {update.task_id}] Dropping status '{update.status}' "
+                f"after {errors} server errors"
+            )
     except Exception as e:
         logger.exception(
             f"[Task {update.task_id}] Unexpected error reporting status: {e}"
         )
+    _status_server_errors.pop(update.task_id, None)
+    return True
+
+
+# =============================================================================
+# Task Setup
+# =============================================================================
+
+
+async def _ensure_dirs(*paths: str) -> None:
+    """
+    Create directories off the event loop, skipping ones already created.
+
+    Directory creation on shared storage (often NFS) can take long enough
+    to stall heartbeats, so it runs in a worker thread.
+
+    Args:
+        *paths: Directory paths to create.
+    """
+    missing = set()
+    for path in paths:
+        if path in _ensured_dirs:
+            _ensured_dirs.move_to_end(path)
+        else:
+            missing.add(path)
+    if not missing:
+        return
+
+    def _makedirs():
+        for path in missing:
+            os.makedirs(path, exist_ok=True)
+
+    await asyncio.to_thread(_makedirs)
+    for path in missing:
+        _ensured_dirs[path] = None
+    while len(_ensured_dirs) > MAX_ENSURED_DIRS:
+        _ensured_dirs.popitem(last=False)
 
 
 async def ensure_docker_image_synced(task_id: int, container_name: str) -> bool:
@@ -190,6 +406,49 @@ async def ensure_docker_image_synced(task_id: int, container_name: str) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=4)
+def _build_mount_args(
+    shared_dir: str, local_temp_dir: str, additional_mounts: tuple[str, ...]
+) -> tuple[str, ...]:
+    """
+    Build the '--mount' arguments shared by all task containers.
+
+    Only depends on runner config, so the result is cached per config value
+    instead of being rebuilt and re-parsed for every task launch.
+
+    Args:
+        shared_dir: config.SHARED_DIR.
+        local_temp_dir: config.LOCAL_TEMP_DIR.
+        additional_mounts: config.ADDITIONAL_MOUNTS as a tuple.
+
+    Returns:
+        Flat tuple of '--mount', spec pairs.
+    """
+    # shared_data subdirectory is mounted as /shared inside container
+    # logs directory is mounted as /kohakuriver-logs for task output
+    mount_dirs = [
+        f"{shared_dir}/shared_data:/shared",
+        f"{shared_dir}/logs:/kohakuriver-logs",
+        f"{local_temp_dir}:/local_temp",
+        *additional_mounts,
+    ]
+
+    mount_args: list[str] = []
+    for mount in mount_dirs:
+        parts = mount.split(":")
+        if len(parts) < 2:
+            logger.warning(f"Invalid mount format: '{mount}'. Skipping.")
+            continue
+        host_path, container_path, *options = parts
+        option_str = ("," + ",".join(options)) if options else ""
+        mount_args += [
+            "--mount",
+            f"type=bind,source={host_path},target={container_path}{option_str}",
+        ]
+
+    return tuple(mount_args)
+
+
 def build_docker_run_command(
     task_id: int,
     docker_image_tag: str,
@@ -260,29 +519,11 @@ def build_docker_run_command(
         docker_cmd.extend(["--cap-add", "SYS_NICE"])
 
     # Mount directories
-    # shared_data subdirectory is mounted as /shared inside container
-    # logs directory is mounted as /kohakuriver-logs for task output
-    mount_dirs = [
-        f"{config.SHARED_DIR}/shared_data:/shared",
-        f"{config.SHARED_DIR}/logs:/kohakuriver-logs",
-        f"{config.LOCAL_TEMP_DIR}:/local_temp",
-    ]
-    for mount_spec in config.ADDITIONAL_MOUNTS:
-        mount_dirs.append(mount_spec)
-
-    for mount in mount_dirs:
-        parts = mount.split(":")
-        if len(parts) < 2:
-            logger.warning(f"Invalid mount format: '{mount}'. Skipping.")
-            continue
-        host_path, container_path, *options = parts
-        option_str = ("," + ",".join(options)) if options else ""
-        docker_cmd.extend(
-            [
-                "--mount",
-                f"type=bind,source={host_path},target={container_path}{option_str}",
-            ]
+    docker_cmd.extend(
+        _build_mount_args(
+            config.SHARED_DIR, config.LOCAL_TEMP_DIR, tuple(config.ADDITIONAL_MOUNTS)
         )
+    )
 
     # Working directory
     if working_dir:
@@ -304,16 +545,16 @@ def build_docker_run_command(
         docker_cmd.extend(["--gpus", f'"device={id_string}"'])
 
     # Environment variables
-    for key, value in env_vars.items():
-        docker_cmd.extend(["-e", f"{key}={value}"])
+    docker_cmd += [
+        arg for key, value in env_vars.items() for arg in ("-e", f"{key}={value}")
+    ]
 
     # Add container image
     docker_cmd.append(docker_image_tag)
 
     # Build the inner command (what runs inside the container)
     # Quote arguments for shell
-    quoted_args = [shlex.quote(arg) for arg in arguments]
-    args_str = " ".join(quoted_args) if quoted_args else ""
+    args_str = shlex.join(arguments)
 
     if numa_prefix:
         inner_cmd = f"{numa_prefix} {command} {args_str}".strip()
@@ -333,7 +574,10 @@ def build_docker_run_command(
     # Add shell wrapper
     docker_cmd.extend(["/bin/sh", "-c", shell_cmd])
 
-    logger.debug(f"[Task {task_id}] Full docker command: {docker_cmd}")
+    # Lazy: the argv can be long and is only rendered when debug is enabled
+    logger.opt(lazy=True).debug(
+        f"[Task {task_id}] Full docker command: {{cmd}}", cmd=lambda: docker_cmd
+    )
 
     return docker_cmd
 
@@ -377,6 +621,7 @@ async def execute_task(
     logger.info(f"[Task {task_id}] Stderr: {stderr_path}")
 
     start_time = datetime.datetime.now()
+    start_monotonic = time.monotonic()  # For elapsed-time logging only
     container_name_full = task_container_name(task_id)
 
     # Report pending status
@@ -393,8 +638,7 @@ async def execute_task(
     logger.info(f"[Task {task_id}] Creating output directories...")
     logger.debug(f"[Task {task_id}]   stdout dir: {os.path.dirname(stdout_path)}")
     logger.debug(f"[Task {task_id}]   stderr dir: {os.path.dirname(stderr_path)}")
-    os.makedirs(os.path.dirname(stdout_path), exist_ok=True)
-    os.makedirs(os.path.dirname(stderr_path), exist_ok=True)
+    await _ensure_dirs(os.path.dirname(stdout_path), os.path.dirname(stderr_path))
 
     # =========================================================================
     # Step 1: Ensure Docker image is synced from shared storage
@@ -406,14 +650,7 @@ async def execute_task(
     if not await ensure_docker_image_synced(task_id, container_name):
         error_message = f"Docker image sync failed for container '{container_name}'"
         logger.error(f"[Task {task_id}] {error_message}")
-        await report_status_to_host(
-            TaskStatusUpdate(
-                task_id=task_id,
-                status="failed",
-                message=error_message,
-                completed_at=datetime.datetime.now(),
-            )
-        )
+        await _report_task_failed(task_id, error_message)
         logger.info(
             f"[Task {task_id}] ========== TASK EXECUTION FAILED (image sync) =========="
         )
@@ -426,14 +663,19 @@ async def execute_task(
     # =========================================================================
     logger.info(f"[Task {task_id}] Step 2: Building task configuration...")
 
-    # Build environment variables
-    task_env = env_vars.copy()
-    task_env["KOHAKURIVER_TASK_ID"] = str(task_id)
-    task_env["KOHAKURIVER_LOCAL_TEMP_DIR"] = config.LOCAL_TEMP_DIR
-    task_env["KOHAKURIVER_SHARED_DIR"] = config.SHARED_DIR
+    # Build environment variables (task-specified + KOHAKURIVER_* only)
+    task_env = {
+        **env_vars,
+        "KOHAKURIVER_TASK_ID": str(task_id),
+        "KOHAKURIVER_LOCAL_TEMP_DIR": config.LOCAL_TEMP_DIR,
+        "KOHAKURIVER_SHARED_DIR": config.SHARED_DIR,
+    }
     if target_numa_node_id is not None:
         task_env["KOHAKURIVER_TARGET_NUMA_NODE"] = str(target_numa_node_id)
-    logger.debug(f"[Task {task_id}] Environment variables: {list(task_env.keys())}")
+    logger.opt(lazy=True).debug(
+        f"[Task {task_id}] Environment variables: {{keys}}",
+        keys=lambda: list(task_env),
+    )
 
     # Get NUMA prefix if applicable
     numa_prefix = get_numa_prefix(target_numa_node_id, numa_topology)
@@ -499,13 +741,16 @@ async def execute_task(
         )
 
         logger.info(
-            f"[Task {task_id}] Starting subprocess: {' '.join(shlex.quote(c) for c in docker_cmd[:10])}..."
+            f"[Task {task_id}] Starting subprocess: {shlex.join(docker_cmd[:10])}..."
         )
 
         # Run the docker command via async subprocess
+        # The task's own output is redirected to its log files inside the
+        # container, so the client's stdout carries nothing; only docker's
+        # stderr (pull/startup errors) is captured.
         process = await asyncio.create_subprocess_exec(
             *docker_cmd,
-            stdout=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
             stderr=asyncio.subprocess.PIPE,
         )
         logger.debug(f"[Task {task_id}] Subprocess PID: {process.pid}")
@@ -513,38 +758,32 @@ async def execute_task(
         logger.info(f"[Task {task_id}] Container started, waiting for completion...")
 
         # Wait for process to finish
-        stdout_data, stderr_data = await process.communicate()
+        _, stderr_data = await process.communicate()
         exit_code = process.returncode
 
         logger.info(f"[Task {task_id}] Container finished with exit code: {exit_code}")
-        if stdout_data:
-            logger.debug(
-                f"[Task {task_id}] Docker stdout: {stdout_data.decode(errors='replace').strip()}"
-            )
         if stderr_data:
-            logger.debug(
-                f"[Task {task_id}] Docker stderr: {stderr_data.decode(errors='replace').strip()}"
+            logger.opt(lazy=True).debug(
+                f"[Task {task_id}] Docker stderr: {{err}}",
+                err=lambda: stderr_data.decode(errors="replace").strip(),
             )
 
-        # Check if task was killed by host (kill_task removes from store before we get here)
-        # If task is no longer in store, it was killed externally - don't report status
-        task_data = task_store.get_task(task_id)
+        # Stop tracking the task. kill_task removes it from the store before
+        # killing the container, so if it is already gone the task was killed
+        # externally - don't report status. One pop does check and removal.
+        task_data = task_store.remove_task(task_id)
         logger.debug(f"[Task {task_id}] Task data in store: {task_data}")
         if task_data is None:
             logger.info(
                 f"[Task {task_id}] Task was removed from store (likely killed by host). "
                 "Skipping status report."
             )
-            elapsed = (datetime.datetime.now() - start_time).total_seconds()
+            elapsed = time.monotonic() - start_monotonic
             logger.info(
                 f"[Task {task_id}] ========== TASK KILLED EXTERNALLY ({elapsed:.2f}s) =========="
             )
             return
 
-        # Remove from tracking (task still exists, so this is normal completion)
-        logger.debug(f"[Task {task_id}] Removing task from task_store...")
-        task_store.remove_task(task_id)
-
         # Determine final status
         # Exit code 137 = 128 + 9 (SIGKILL) - could be OOM or manual kill
         # Exit code 143 = 128 + 15 (SIGTERM) - graceful termination
@@ -583,7 +822,7 @@ async def execute_task(
             )
         )
 
-        elapsed = (datetime.datetime.now() - start_time).total_seconds()
+        elapsed = time.monotonic() - start_monotonic
         logger.info(
             f"[Task {task_id}] ========== TASK EXECUTION COMPLETED ({elapsed:.2f}s) =========="
         )
@@ -596,20 +835,11 @@ async def execute_task(
         # Remove from tracking
         task_store.remove_task(task_id)
 
-        # Report failure
-        await report_status_to_host(
-            TaskStatusUpdate(
-                task_id=task_id,
-                status="failed",
-                message=error_message,
-                started_at=start_time,
-                completed_at=datetime.datetime.now(),
-            )
-        )
+        await _report_task_failed(task_id, error_message, started_at=start_time)
         logger.info(f"[Task {task_id}] ========== TASK EXECUTION FAILED ==========")
 
 
-def kill_task(
+async def kill_task(
     task_id: int,
     container_name: str,
     task_store: TaskStateStore,
@@ -617,6 +847,9 @@ def kill_task(
     """
     Kill a running task.
 
+    The task store is updated on the event loop; only the blocking Docker
+    API call runs in a worker thread.
+
     Args:
         task_id: Task ID to kill.
         container_name: Docker container name (e.g., kohakuriver-task-123 or kohakuriver-vps-123).
@@ -632,25 +865,20 @@ def kill_task(
         logger.debug(f"Removing task {task_id} from task_store...")
         task_store.remove_task(task_id)
 
-        # Kill the container using docker kill
+        # Kill the container through the Docker API (no docker CLI spawn)
         logger.debug(f"Killing container {container_name}...")
-        result = _run_docker_command(["docker", "kill", container_name], check=False)
-
-        if result.returncode == 0:
+        if await asyncio.to_thread(get_docker_manager().kill_container, container_name):
             logger.info(f"Killed task {task_id}")
-            return True
         else:
-            logger.warning(
-                f"docker kill returned {result.returncode} for task {task_id}: {result.stderr}"
-            )
-            return True  # Still return True since task was removed from tracking
+            logger.warning(f"docker kill failed for task {task_id}")
+        return True  # Task was removed from tracking either way
 
     except Exception as e:
         logger.error(f"Failed to kill task {task_id}: {e}")
         return False
 
 
-def pause_task(
+async def pause_task(
     task_id: int,
     container_name: str,
     task_store: TaskStateStore,
@@ -669,13 +897,13 @@ def pause_task(
     logger.debug(f"pause_task called: task_id={task_id}, container={container_name}")
 
     try:
-        result = _run_docker_command(["docker", "pause", container_name], check=False)
-
-        if result.returncode == 0:
+        if await asyncio.to_thread(
+            get_docker_manager().pause_container, container_name
+        ):
             logger.info(f"Paused task {task_id}")
             return True
         else:
-            logger.error(f"Failed to pause task {task_id}: {result.stderr}")
+            logger.error(f"Failed to pause task {task_id}")
             return False
 
     except Exception as e:
@@ -683,7 +911,7 @@ def pause_task(
         return False
 
 
-def resume_task(
+async def resume_task(
     task_id: int,
     container_name: str,
     task_store: TaskStateStore,
@@ -702,13 +930,13 @@ def resume_task(
     logger.debug(f"resume_task called: task_id={task_id}, container={container_name}")
 
     try:
-        result = _run_docker_command(["docker", "unpause", container_name], check=False)
-
-        if result.returncode == 0:
+        if await asyncio.to_thread(
+            get_docker_manager().unpause_container, container_name
+        ):
             logger.info(f"Resumed task {task_id}")
             return True
         else:
-            logger.error(f"Failed to resume task {task_id}: {result.stderr}")
+            logger.error(f"Failed to resume task {task_id}")
             return False
 
     except Exception as e:
@@ -424,7 +424,10 @@ def _build_vps_docker_command(
     docker_cmd.append(docker_image_tag)
     docker_cmd.extend(["/bin/sh", "-c", setup_cmd])
 
-    logger.debug(f"VPS {task_id} docker command: {' '.join(docker_cmd)}")
+    # Lazy: the argv can be long and is only rendered when debug is enabled
+    logger.opt(lazy=True).debug(
+        f"VPS {task_id} docker command: {{cmd}}", cmd=lambda: " ".join(docker_cmd)
+    )
     return docker_cmd
 
 
@@ -484,6 +487,35 @@ async def _find_ssh_port(
     return 0
 
 
+async def _fail_vps_creation(
+    task_id: int, error_message: str, exit_code: int | None = None
+) -> dict:
+    """
+    Report a failed VPS creation to the host.
+
+    Args:
+        task_id: VPS task ID.
+        error_message: Failure reason reported to the host.
+        exit_code: Docker exit code, if the failure came from docker run.
+
+    Returns:
+        Failure result dictionary for create_vps.
+    """
+    await report_status_to_host(
+        TaskStatusUpdate(
+            task_id=task_id,
+            status="failed",
+            message=error_message,
+            exit_code=exit_code,
+            completed_at=datetime.datetime.now(),
+        )
+    )
+    return {
+        "success": False,
+        "error": error_message,
+    }
+
+
 async def create_vps(
     task_id: int,
     required_cores: int,
@@ -558,18 +590,7 @@ async def create_vps(
         if not await ensure_docker_image_synced(task_id, container_name):
             error_message = f"Docker image sync failed for container '{container_name}'"
             logger.error(f"VPS {task_id}: {error_message}")
-            await report_status_to_host(
-                TaskStatusUpdate(
-                    task_id=task_id,
-                    status="failed",
-                    message=error_message,
-                    completed_at=datetime.datetime.now(),
-                )
-            )
-            return {
-                "success": False,
-                "error": error_message,
-            }
+            return await _fail_vps_creation(task_id, error_message)
 
     # =========================================================================
     # Step 3: Build mount directories
@@ -616,10 +637,10 @@ async def create_vps(
         stdout, stderr = await process.communicate()
         exit_code = process.returncode
 
-        logger.debug(
-            f"VPS {task_id} docker run exit code: {exit_code}: "
-            f"{stdout.decode(errors='replace').strip()} | "
-            f"{stderr.decode(errors='replace').strip()}"
+        logger.opt(lazy=True).debug(
+            f"VPS {task_id} docker run exit code: {exit_code}: {{out}} | {{err}}",
+            out=lambda: stdout.decode(errors="replace").strip(),
+            err=lambda: stderr.decode(errors="replace").strip(),
         )
 
         if exit_code != 0:
@@ -627,19 +648,7 @@ async def create_vps(
                 f"Docker run failed: {stderr.decode(errors='replace').strip()}"
             )
             logger.error(f"VPS {task_id}: {error_message}")
-            await report_status_to_host(
-                TaskStatusUpdate(
-                    task_id=task_id,
-                    status="failed",
-                    message=error_message,
-                    exit_code=exit_code,
-                    completed_at=datetime.datetime.now(),
-                )
-            )
-            return {
-                "success": False,
-                "error": error_message,
-            }
+            return await _fail_vps_creation(task_id, error_message, exit_code)
 
         # Find the actual SSH port (only if SSH is enabled)
         container_name_full = vps_container_name(task_id)
@@ -690,21 +699,7 @@ async def create_vps(
         error_message = f"VPS creation failed: {e}"
         logger.error(error_message)
         logger.debug(format_traceback(e))
-
-        # Report failure
-        await report_status_to_host(
-            TaskStatusUpdate(
-                task_id=task_id,
-                status="failed",
-                message=error_message,
-                completed_at=datetime.datetime.now(),
-            )
-        )
-
-        return {
-            "success": False,
-            "error": error_message,
-        }
+        return await _fail_vps_creation(task_id, error_message)
 
 
 async def stop_vps(
@@ -2,6 +2,10 @@
 
 import asyncio
 
+# Max bytes per read; matches the default Linux pipe/socket buffer scale so
+# bulk transfers (scp, rsync) are not split into tiny writes
+READ_CHUNK_SIZE = 64 * 1024
+
 
 async def bind_reader_writer(
     reader: asyncio.StreamReader,
@@ -16,7 +20,7 @@ async def bind_reader_writer(
     """
     while True:
         try:
-            data = await reader.read(1024)
+            data = await reader.read(READ_CHUNK_SIZE)
             if not data:
                 break
             writer.write(data)
@@ -81,7 +81,7 @@ class RunnerStateStore:
 
     def __len__(self) -> int:
         """Return number of items."""
-        return len(list(self.vault))
+        return sum(1 for _ in self.vault)
 
     # -------------------------------------------------------------------------
     # Dict Methods
@@ -118,7 +118,7 @@ class RunnerStateStore:
     def clear(self) -> None:
         """Remove all items from the store."""
         for key in list(self.vault):
-            del self.vault[key]
+            del self[key]
 
     def pop(self, key: str, default: dict | None = None) -> dict | None:
         """
@@ -133,7 +133,7 @@ class RunnerStateStore:
         """
         try:
             value = self.vault[key]
-            del self.vault[key]
+            del self[key]
             return value
         except KeyError:
             return default
@@ -150,6 +150,10 @@ class TaskStateStore(RunnerStateStore):
 
     Persists task state including container name, allocated resources,
     and NUMA node binding for recovery after runner restart.
+
+    The set of task IDs is cached in memory and invalidated on every
+    write, since it is read on each heartbeat but changes only when
+    tasks start or finish.
     """
 
     def __init__(self, db_path: str):
@@ -160,6 +164,17 @@ class TaskStateStore(RunnerStateStore):
             db_path: Path to the SQLite database file.
         """
         super().__init__(db_path, table="running_tasks")
+        self._task_ids: tuple[int, ...] | None = None
+
+    def __setitem__(self, key: str, value: dict) -> None:
+        """Set a value by key."""
+        super().__setitem__(key, value)
+        self._task_ids = None
+
+    def __delitem__(self, key: str) -> None:
+        """Delete a value by key."""
+        super().__delitem__(key)
+        self._task_ids = None
 
     def add_task(
         self,
@@ -217,7 +232,9 @@ class TaskStateStore(RunnerStateStore):
 
     def get_all_task_ids(self) -> list[int]:
         """Return all running task IDs as integers."""
-        return [int(k) for k in self.keys()]
+        if self._task_ids is None:
+            self._task_ids = tuple(int(k) for k in self.vault)
+        return list(self._task_ids)
 
 
 class VPSStateStore(RunnerStateStore):
@@ -7,6 +7,7 @@ This module provides a comprehensive logging system with:
     - Module name prefixes for easy source identification
     - Beautiful traceback formatting
     - Uvicorn/standard library logging interception
+    - Non-blocking sink writes (records are queued to a writer thread)
 
 Log Format:
     TIME | LEVEL | MODULE - message
@@ -158,6 +159,7 @@ def configure_logging(
     level: LogLevel = LogLevel.INFO,
     simple_format: bool = True,
     intercept_stdlib: bool = True,
+    enqueue: bool = False,
 ) -> None:
     """
     Configure HakuRiver logging with loguru.
@@ -169,6 +171,10 @@ def configure_logging(
         level: Log verbosity level.
         simple_format: Use simpler format without function/line info.
         intercept_stdlib: Intercept standard library logging (uvicorn, etc.).
+        enqueue: Hand records to a background writer thread instead of
+            writing to stderr inside the caller (keeps the event loop free
+            of blocking writes). Meant for the long-running servers; the
+            caller must call flush_logging() on shutdown.
 
     Example:
         from kohakuriver.utils.logger import configure_logging
@@ -200,6 +206,7 @@ def configure_logging(
         colorize=True,
         backtrace=level in (LogLevel.FULL, LogLevel.DEBUG),
         diagnose=level == LogLevel.FULL,
+        enqueue=enqueue,
     )
 
     # Intercept standard library logging
@@ -235,6 +242,16 @@ def get_logger(name: str):
     return _loguru_logger.bind(name=name)
 
 
+async def flush_logging() -> None:
+    """
+    Wait until all queued log records have been written.
+
+    Should be awaited at the end of application shutdown when logging
+    was configured with enqueue=True.
+    """
+    await _loguru_logger.complete()
+
+
 # =============================================================================
 # Traceback Formatting
 # =============================================================================
@@ -315,6 +332,7 @@ def format_traceback_compact(exc: BaseException | None = None) -> str:
 __all__ = [
     "get_logger",
     "configure_logging",
+    "flush_logging",
     "intercept_standard_logging",
     "format_traceback",
     "format_traceback_compact",